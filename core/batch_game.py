@@ -0,0 +1,55 @@
+# core/batch_game.py
+
+from typing import List, Optional, Sequence, Union
+
+from .board import Board
+from .player import Player
+from .game import Game, Action
+
+
+class GameBatch:
+    """
+    Many independent 2 player games advanced together, for self-play / training.
+
+    All boards are clones of one loaded board, so they share the topology
+    tables and only copy the mutable state. step() advances every game by
+    one action in a single call; the scalar Game stays the unit of logic,
+    so the UI and the batch run exactly the same rules.
+    Everything here is plain Python (no C extensions), so for long training
+    runs the same scripts can be started with pypy3 instead of python.
+    """
+
+    __slots__ = ("games",)
+
+    def __init__(self, board_path: str, num_games: int):
+        template = Board()
+        template.load_from_json(board_path)
+        self.games: List[Game] = [
+            Game(template.clone(), Player(1), Player(2)) for _ in range(num_games)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.games)
+
+    def step(self, actions: Sequence[Union[Action, str]], targets: Optional[Sequence] = None) -> List[bool]:
+        """
+        Advance game i by actions[i] on targets[i] (see Game.advance_one_action).
+        targets may be omitted for actions that take no target.
+        Returns the success flag of every game, finished games always report False.
+        """
+        advance = Game.advance_one_action
+        if targets is None:
+            return [advance(game, action) for game, action in zip(self.games, actions)]
+        return [advance(game, action, target) for game, action, target in zip(self.games, actions, targets)]
+
+    def unfinished(self) -> List[int]:
+        """Indices of the games still running."""
+        return [i for i, game in enumerate(self.games) if not game.finished]
+
+    def resources(self) -> List[List[List[int]]]:
+        """[game][player - 1][resource index] counts; the players' own lists, not copies."""
+        return [[game.p1.resources, game.p2.resources] for game in self.games]
+
+    def winners(self) -> List[int]:
+        """Winner of every game (0 for a tie or a game still running)."""
+        return [game.winner for game in self.games]
@@ -1,60 +1,58 @@
 # core/board.py
 
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Iterable, Optional, Set, Tuple
+import copy
 import json
 
 class Node:
     """
     A settlement/city position: there is 54 on a board
     """
+    __slots__ = ("id", "hexes", "port", "occupant", "neighbours", "adjacent_roads")
+
     def __init__(self, node_id: int):
         self.id: int = node_id
         self.hexes: List[int] = [] # Hex IDs adjacent to this node
         self.port: str = ""  # Port type if any, else empty string
         self.occupant: int = 0  # 0 = empty, 1 = player 1 settlement, 2 = player 2 settlement, 3 = player 1 city, 4 = player 2 city
-        self.neighbours: List[int] = []  # Node IDs adjacent to this node - there must be a road between them, used for traversing
-        self.adjacent_roads: List[int] = []  # Road IDs connected to this node
+        self.neighbours: bytes = b""  # Node IDs adjacent to this node - there must be a road between them, used for traversing
+        self.adjacent_roads: bytes = b""  # Road IDs connected to this node (ids fit in a byte, so stored unboxed)
 
     def __repr__(self):
         return f"Node({self.id}, occupant={self.occupant}, port={self.port})"
     
 
+# probability of rolling each total with two dice, indexed by the total
+# (0 for 7, since a 7 never produces)
+DICE_PROBABILITIES: Tuple[float, ...] = (
+    0.0, 0.0, 1/36, 2/36, 3/36, 4/36, 5/36, 0.0, 5/36, 4/36, 3/36, 2/36, 1/36
+)
+
+
 class HexTile:
     """
     A resource hex (wood, brick, sheep, wheat, ore): there are 18 on a board
     """
+    __slots__ = ("id", "resource", "dice_number", "probability", "nodes")
+
     def __init__(self, hex_id: int, resource: str, dice_number: int):
         self.id: int = hex_id
         self.resource: str = resource
         self.dice_number: int = dice_number
-        self.probability: float = 0.0  # Probability of producing resources on a roll
-        self.calculate_probability()
+        # Probability of producing resources on a roll
+        self.probability: float = DICE_PROBABILITIES[dice_number] if 2 <= dice_number <= 12 else 0.0
         self.nodes: List[int] = []  # Node IDs surrounding this hex
 
     def __repr__(self):
         return f"HexTile({self.id}, resource={self.resource}, dice_number={self.dice_number}, probability={self.probability})"
-    
-    def calculate_probability(self):
-        """Calculate the probability of this hex producing resources based on its dice number."""
-        dice_probabilities = {
-            2: 1/36,
-            3: 2/36,
-            4: 3/36,
-            5: 4/36,
-            6: 5/36,
-            8: 5/36,
-            9: 4/36,
-            10: 3/36,
-            11: 2/36,
-            12: 1/36
-        }
-        self.probability = dice_probabilities.get(self.dice_number, 0.0)
 
 
 class Road:
     """
     Represents a road connecting two nodes
     """
+    __slots__ = ("id", "nodes", "owner")
+
     def __init__(self, road_id: int, node_a: int, node_b: int):
         self.id: int = road_id
         self.nodes: Tuple[int, int] = (node_a, node_b) # Node IDs this road connects
@@ -64,16 +62,141 @@ class Road:
         return f"Road({self.id}, nodes={self.nodes}, owner={self.owner})" 
     
 
+RESOURCES: Tuple[str, ...] = ("brick", "wood", "sheep", "wheat", "ore")
+RESOURCE_INDEX: Dict[str, int] = {res: i for i, res in enumerate(RESOURCES)}
+BRICK, WOOD, SHEEP, WHEAT, ORE = range(len(RESOURCES))  # indices into RESOURCES / Player.resources
+
+
+class BoardTopology:
+    """
+    The fixed part of a board loaded from JSON: which roads touch which
+    nodes, which nodes surround which hexes, dice numbers and resources.
+    It never changes during a game, so it is built once per file and
+    shared by every Board loaded from that file (see BoardTopology.load).
+    Ids are expected to be dense (0..n-1), as they are in board.json.
+    """
+    def __init__(self, data: Dict):
+        self.data: Dict = data  # the parsed JSON, used to build the Node/Road/HexTile objects
+
+        num_nodes = len(data['village_spots'])
+        num_roads = len(data['roads'])
+        num_hexes = len(data['resource_hexes'])
+
+        node_adj_roads: List[bytes] = [b""] * num_nodes
+        node_adj_roads_mask: List[int] = [0] * num_nodes
+        for node_data in data['village_spots']:
+            node_adj_roads[node_data['id']] = bytes(node_data['adjacent_roads'])
+            node_adj_roads_mask[node_data['id']] = sum(1 << road_id for road_id in set(node_data['adjacent_roads']))
+        # id lists are stored as bytes (all ids < 256): compact and iterate as plain ints
+        self.node_adj_roads: Tuple[bytes, ...] = tuple(node_adj_roads)  # node_id -> road ids touching it
+        self.node_adj_roads_mask: Tuple[int, ...] = tuple(node_adj_roads_mask)  # node_id -> bitmask of node_adj_roads (bit road_id)
+
+        road_nodes: List[Tuple[int, int]] = [(0, 0)] * num_roads
+        for road_data in data['roads']:
+            road_nodes[road_data['id']] = (road_data['village_ids'][0], road_data['village_ids'][1])
+        self.road_nodes: Tuple[Tuple[int, int], ...] = tuple(road_nodes)  # road_id -> (node_a, node_b)
+
+        # road_id -> edge bit (1 << edge id), roads joining the same two nodes share one
+        edge_ids: Dict[Tuple[int, int], int] = {}
+        self.road_edge_bit: Tuple[int, ...] = tuple(
+            1 << edge_ids.setdefault((min(a, b), max(a, b)), len(edge_ids)) for a, b in road_nodes
+        )
+
+        hex_dice: List[int] = [0] * num_hexes
+        hex_nodes: List[bytes] = [b""] * num_hexes
+        hex_resource: List[int] = [-1] * num_hexes
+        for hex_data in data['resource_hexes']:
+            hex_dice[hex_data['id']] = hex_data['dice_number']
+            hex_nodes[hex_data['id']] = bytes(hex_data['village_spots'])
+            hex_resource[hex_data['id']] = RESOURCE_INDEX.get(hex_data['type'], -1)
+        self.hex_dice: Tuple[int, ...] = tuple(hex_dice)  # hex_id -> dice number
+        self.hex_nodes: Tuple[bytes, ...] = tuple(hex_nodes)  # hex_id -> node ids around it
+        self.hex_resource: Tuple[int, ...] = tuple(hex_resource)  # hex_id -> index into RESOURCES (-1 if none)
+
+        # dice roll -> parallel tuples of (node ids, resource index) that produce on that roll, in hex order
+        roll_to_pairs: Dict[int, List[Tuple[int, int]]] = {d: [] for d in range(2, 13)}
+        for hex_id in range(num_hexes):
+            resource_idx = hex_resource[hex_id]
+            if resource_idx < 0 or hex_dice[hex_id] not in roll_to_pairs: # non-producing hex (desert)
+                continue
+            for node_id in hex_nodes[hex_id]:
+                roll_to_pairs[hex_dice[hex_id]].append((node_id, resource_idx))
+        self.roll_to_nodes: Dict[int, Tuple[int, ...]] = {d: tuple(n for n, _ in pairs) for d, pairs in roll_to_pairs.items()}
+        self.roll_to_resource: Dict[int, Tuple[int, ...]] = {d: tuple(r for _, r in pairs) for d, pairs in roll_to_pairs.items()}
+
+        # board.json's per-node adjacent_roads do not always agree with the roads' own
+        # endpoints, so both directions are indexed to match the single-spot checks exactly
+        nodes_listing_road: List[List[int]] = [[] for _ in range(num_roads)]
+        roads_ending_at: List[List[int]] = [[] for _ in range(num_nodes)]
+        for node_id, adj_roads in enumerate(node_adj_roads):
+            for road_id in adj_roads:
+                nodes_listing_road[road_id].append(node_id)
+        for road_id, (a, b) in enumerate(road_nodes):
+            roads_ending_at[a].append(road_id)
+            roads_ending_at[b].append(road_id)
+        self.nodes_listing_road: Tuple[bytes, ...] = tuple(bytes(n) for n in nodes_listing_road)  # road_id -> nodes whose adjacent_roads contain it
+        self.roads_ending_at: Tuple[bytes, ...] = tuple(bytes(r) for r in roads_ending_at)  # node_id -> roads that have it as an endpoint
+
+    @classmethod
+    def load(cls, path: str) -> "BoardTopology":
+        """Load the topology from a JSON file, reusing the one already loaded from that path."""
+        topology = _TOPOLOGY_CACHE.get(path)
+        if topology is None:
+            with open(path, 'r') as f:
+                topology = cls(json.load(f))
+            _TOPOLOGY_CACHE[path] = topology
+        return topology
+
+
+_TOPOLOGY_CACHE: Dict[str, BoardTopology] = {}
+
+
 class Board:
     """
     Represents the full state of the board:
     nodes, hexes, and roads
+
+    Besides the Node/Road/HexTile objects, the board keeps a flat
+    structure-of-arrays copy indexed by id, which the legality checks
+    and production use instead of chasing dicts and attributes.
+    The fixed part of it is a BoardTopology shared between boards.
     """
     def __init__(self):
         self.nodes: Dict[int, Node] = {}
         self.hexes: Dict[int, HexTile] = {}
         self.roads: Dict[int, Road] = {}
         self.ports: Dict[int, str] = {} # node_id to port type mapping
+        self.topology_version: int = 0  # bumped on every build, lets callers cache derived data
+
+        # shared fixed topology and its flat tables, attached by load_from_json
+        self.topology: Optional[BoardTopology] = None
+        self.node_adj_roads: Tuple[bytes, ...] = ()
+        self.node_adj_roads_mask: Tuple[int, ...] = ()
+        self.road_nodes: Tuple[Tuple[int, int], ...] = ()
+        self.road_edge_bit: Tuple[int, ...] = ()
+        self.hex_dice: Tuple[int, ...] = ()
+        self.hex_nodes: Tuple[bytes, ...] = ()
+        self.hex_resource: Tuple[int, ...] = ()
+        self._roll_to_nodes: Dict[int, Tuple[int, ...]] = {}
+        self._roll_to_resource: Dict[int, Tuple[int, ...]] = {}
+        self._nodes_listing_road: Tuple[bytes, ...] = ()
+        self._roads_ending_at: Tuple[bytes, ...] = ()
+
+        # flat mutable state, filled by load_from_json
+        self.node_occupant: bytearray = bytearray()  # node_id -> occupant code (same as Node.occupant)
+        self.road_owner: bytearray = bytearray()  # road_id -> owner (same as Road.owner)
+        self.player_road_bits: List[int] = [0, 0, 0]  # player_id -> bitmask of owned road ids (index 0 unused)
+
+        # per-player road graph, kept up to date by the mutators:
+        # player_id -> {node_id: [(neighbour node, edge bit), ...]}
+        self.player_road_adj: Dict[int, Dict[int, List[Tuple[int, int]]]] = {1: {}, 2: {}}
+
+        # per-player sets kept up to date by the mutators, so the list_legal_* queries
+        # only look at nodes the player already touches
+        self._legal_cities: Dict[int, Set[int]] = {1: set(), 2: set()}  # nodes with the player's settlement
+        self._candidate_road_nodes: Dict[int, Set[int]] = {1: set(), 2: set()}  # nodes listing one of the player's roads as adjacent
+        # results of the list_legal_* queries, keyed by (query, player, flag); emptied by every mutator
+        self._legal_cache: Dict[Tuple[int, int, bool], List[int]] = {}
 
     # --- Initialization ---
 
@@ -81,25 +204,26 @@ class Board:
         """
         Populate the board from a JSON file, the nodes, hexes, and roads
         """
-        with open(path, 'r') as f:
-            data = json.load(f)
+        self._attach_topology(BoardTopology.load(path))
+        data = self.topology.data
         
         # load hexes
         for hex_data in data['resource_hexes']:
             hex_tile = HexTile(hex_data['id'], hex_data['type'], hex_data['dice_number'])
-            hex_tile.nodes = hex_data['village_spots']
+            hex_tile.nodes = list(hex_data['village_spots'])
             self.hexes[hex_tile.id] = hex_tile
         
         # load nodes
         for node_data in data['village_spots']:
             node = Node(node_data['id'])
-            node.hexes = node_data['adjacent_hexes']
-            node.adjacent_roads = node_data['adjacent_roads']
+            node.hexes = list(node_data['adjacent_hexes'])
+            node.adjacent_roads = self.topology.node_adj_roads[node.id]
             node.occupant = 0  # Initially unoccupied
             node.port = node_data["port"]
             self.nodes[node.id] = node
 
         # load roads and link neighbours
+        neighbours: Dict[int, List[int]] = {node_id: [] for node_id in self.nodes}
         for road_data in data['roads']:
             road = Road(road_data['id'], road_data["village_ids"][0], road_data['village_ids'][1])
             road.owner = 0  # Initially unowned
@@ -107,8 +231,10 @@ class Board:
 
             # link neighbours
             node_a, node_b = road.nodes
-            self.nodes[node_a].neighbours.append(node_b)
-            self.nodes[node_b].neighbours.append(node_a)
+            neighbours[node_a].append(node_b)
+            neighbours[node_b].append(node_a)
+        for node_id, node_neighbours in neighbours.items():
+            self.nodes[node_id].neighbours = bytes(node_neighbours)
 
         # link ports
         for port_data in data['ports']:
@@ -118,6 +244,93 @@ class Board:
                 self.nodes[village_id].port = port_type
                 self.ports[village_id] = port_type
 
+        self._build_state()
+
+    def _attach_topology(self, topology: BoardTopology):
+        """
+        Point the board at the shared topology tables
+        (kept as plain attributes so the hot paths need one lookup).
+        """
+        self.topology = topology
+        self.node_adj_roads = topology.node_adj_roads
+        self.node_adj_roads_mask = topology.node_adj_roads_mask
+        self.road_nodes = topology.road_nodes
+        self.road_edge_bit = topology.road_edge_bit
+        self.hex_dice = topology.hex_dice
+        self.hex_nodes = topology.hex_nodes
+        self.hex_resource = topology.hex_resource
+        self._roll_to_nodes = topology.roll_to_nodes
+        self._roll_to_resource = topology.roll_to_resource
+        self._nodes_listing_road = topology.nodes_listing_road
+        self._roads_ending_at = topology.roads_ending_at
+
+    def _build_state(self):
+        """
+        Fill the flat mutable state from the loaded nodes and roads.
+        """
+        self.node_occupant = bytearray(len(self.nodes))
+        self.road_owner = bytearray(len(self.roads))
+        self.player_road_bits = [0, 0, 0]
+
+        for node_id, node in self.nodes.items():
+            self.node_occupant[node_id] = node.occupant
+        for road_id, road in self.roads.items():
+            self.road_owner[road_id] = road.owner
+            if road.owner != 0:
+                self.player_road_bits[road.owner] |= 1 << road_id
+
+        self.player_road_adj = {1: {}, 2: {}}
+        self._candidate_road_nodes = {1: set(), 2: set()}
+        for road_id, owner in enumerate(self.road_owner):
+            if owner != 0:
+                self._link_road(road_id, owner)
+                self._candidate_road_nodes[owner].update(self._nodes_listing_road[road_id])
+        self._legal_cache = {}
+        self._legal_cities = {1: set(), 2: set()}
+        for node_id, occupant in enumerate(self.node_occupant):
+            if occupant in (1, 2):
+                self._legal_cities[occupant].add(node_id)
+
+    def clone(self) -> "Board":
+        """
+        Copy of the board that can be mutated independently.
+        The topology, hexes and ports are shared; only the state is copied.
+        """
+        new = Board()
+        new._attach_topology(self.topology)
+        new.hexes = self.hexes
+        new.ports = self.ports
+        new.nodes = {node_id: copy.copy(node) for node_id, node in self.nodes.items()}
+        new.roads = {road_id: copy.copy(road) for road_id, road in self.roads.items()}
+        new.topology_version = self.topology_version
+
+        new.node_occupant = bytearray(self.node_occupant)
+        new.road_owner = bytearray(self.road_owner)
+        new.player_road_bits = list(self.player_road_bits)
+        new.player_road_adj = {
+            player: {node_id: list(edges) for node_id, edges in adj.items()}
+            for player, adj in self.player_road_adj.items()
+        }
+        new._legal_cities = {player: set(spots) for player, spots in self._legal_cities.items()}
+        new._candidate_road_nodes = {player: set(spots) for player, spots in self._candidate_road_nodes.items()}
+        return new
+
+    def _link_road(self, road_id: int, player: int):
+        """
+        Add a road to the player's road graph.
+        Roads cannot be followed out of a node blocked by the opponent's
+        settlement/city, but still count when entered from the free endpoint.
+        """
+        adj = self.player_road_adj[player]
+        blocked = (2, 4) if player == 1 else (1, 3)
+        node_occupant = self.node_occupant
+        a, b = self.road_nodes[road_id]
+        edge_bit = self.road_edge_bit[road_id]
+        if node_occupant[a] not in blocked:
+            adj.setdefault(a, []).append((b, edge_bit))
+        if node_occupant[b] not in blocked:
+            adj.setdefault(b, []).append((a, edge_bit))
+
     # --- Game State Logic ---
 
     def settlement_is_legal(self, node_id: int, player: int, start_of_the_game: bool) -> bool:
@@ -129,20 +342,13 @@ class Board:
         - The node must be unoccupied.
         - The node must be connected to a road owned by the player.
         """
-        node = self.nodes[node_id]
-        if start_of_the_game:
-            return node.occupant == 0  # Can build if unoccupied
-        # else
         # check if node is occupied
-        if node.occupant != 0:
+        if self.node_occupant[node_id] != 0:
             return False
+        if start_of_the_game:
+            return True  # Can build anywhere unoccupied
         # check if node is connected to a road owned by the player
-        connected_to_road = any(
-            self.roads[road_id].owner == player
-            for road_id in node.adjacent_roads
-        )
-        
-        return connected_to_road
+        return (self.node_adj_roads_mask[node_id] & self.player_road_bits[player]) != 0
 
 
     
@@ -152,9 +358,8 @@ class Board:
         
         - The node must be occupied by the player's settlement.
         """
-        node = self.nodes[node_id]
         # Can build a city if the player has a settlement there
-        return node.occupant == player
+        return self.node_occupant[node_id] == player
     
     
     def road_is_legal(self, road_id: int, player: int) -> bool:
@@ -164,55 +369,70 @@ class Board:
         - The road must be unowned.
         - The road must be connected to a settlement/city owned by the player.
         """
-        road = self.roads[road_id]
+        road_owner = self.road_owner
 
         # Check if the road is unowned
-        if road.owner != 0:
+        if road_owner[road_id] != 0:
             return False
         
         # Check if either end of the road is connected to a settlement/city owned by the player
-        node_a, node_b = road.nodes
-        node_a_occupant = self.nodes[node_a].occupant
-        node_b_occupant = self.nodes[node_b].occupant
-        if node_a_occupant == player or node_b_occupant == player:
+        node_a, node_b = self.road_nodes[road_id]
+        node_occupant = self.node_occupant
+        if node_occupant[node_a] == player or node_occupant[node_b] == player:
             return True
         
         # Check if the road is connected to a player's road
-        connected_to_player_road = any(
-            self.roads[adj_road_id].owner == player
-            for adj_road_id in self.nodes[node_a].adjacent_roads + self.nodes[node_b].adjacent_roads
-        )
-        return connected_to_player_road
+        node_adj_roads_mask = self.node_adj_roads_mask
+        mask = node_adj_roads_mask[node_a] | node_adj_roads_mask[node_b]
+        return (mask & self.player_road_bits[player]) != 0
 
     def list_legal_settlement_spots(self, player: int, start_of_the_game: bool) -> List[int]:
         """
         List all legal spots for the player to build a settlement.
+        Outside the start of the game only nodes next to the player's roads can qualify.
         """
-        legal_spots = []
-        for node_id in self.nodes:
-            if self.settlement_is_legal(node_id, player, start_of_the_game):
-                legal_spots.append(node_id)
-        return legal_spots
+        key = (0, player, start_of_the_game)
+        spots = self._legal_cache.get(key)
+        if spots is None:
+            node_occupant = self.node_occupant
+            if start_of_the_game:
+                spots = [node_id for node_id in self.nodes if node_occupant[node_id] == 0]
+            else:
+                spots = sorted(
+                    node_id
+                    for node_id in self._candidate_road_nodes[player]
+                    if node_occupant[node_id] == 0
+                )
+            self._legal_cache[key] = spots
+        return list(spots)  # callers get their own copy, the cached one stays intact
     
     def list_legal_city_spots(self, player: int) -> List[int]:
         """
         List all legal spots for the player to build a city.
         """
-        legal_spots = []
-        for node_id in self.nodes:
-            if self.city_is_legal(node_id, player):
-                legal_spots.append(node_id)
-        return legal_spots
+        key = (1, player, False)
+        spots = self._legal_cache.get(key)
+        if spots is None:
+            spots = self._legal_cache[key] = sorted(self._legal_cities[player])
+        return list(spots)
     
     def list_legal_road_spots(self, player: int) -> List[int]:
         """
         List all legal spots for the player to build a road.
+        Only roads touching the player's settlements or roads can qualify.
         """
-        legal_spots = []
-        for road_id in self.roads:
-            if self.road_is_legal(road_id, player):
-                legal_spots.append(road_id)
-        return legal_spots
+        key = (2, player, False)
+        spots = self._legal_cache.get(key)
+        if spots is None:
+            road_owner = self.road_owner
+            roads_ending_at = self._roads_ending_at
+            legal_spots = set()
+            for node_id in self._legal_cities[player] | self._candidate_road_nodes[player]:
+                for road_id in roads_ending_at[node_id]:
+                    if road_owner[road_id] == 0:
+                        legal_spots.add(road_id)
+            spots = self._legal_cache[key] = sorted(legal_spots)
+        return list(spots)
         
     
 
@@ -222,63 +442,79 @@ class Board:
         """
         Build a settlement at the given node for the player.
         """
-        node = self.nodes[node_id]
-        node.occupant = player  # 1 = player 1 settlement, 2 = player 2 settlement
+        self.nodes[node_id].occupant = player  # 1 = player 1 settlement, 2 = player 2 settlement
+        self.node_occupant[node_id] = player
+        self._legal_cities[player].add(node_id)
+        # the opponent's roads can no longer be followed through this node
+        self.player_road_adj[player ^ 3].pop(node_id, None)
+        self._legal_cache.clear()
+        self.topology_version += 1
     
     def set_city(self, node_id: int, player: int):
         """
         Upgrade a settlement to a city at the given node for the player.
         """
-        node = self.nodes[node_id]
-        if node.occupant == player:
-            node.occupant += 2  # 3 = player 1 city, 4 = player 2 city
+        if self.node_occupant[node_id] == player:
+            self.node_occupant[node_id] = player + 2  # 3 = player 1 city, 4 = player 2 city
+            self.nodes[node_id].occupant = player + 2
+            self._legal_cities[player].discard(node_id)
+            self._legal_cache.clear()
+            self.topology_version += 1
     
     def set_road(self, road_id: int, player: int):
         """
         Build a road between the given nodes for the player.
         """
-        road = self.roads[road_id]
-        road.owner = player  # 1 = player 1, 2 = player 2
+        self.roads[road_id].owner = player  # 1 = player 1, 2 = player 2
+        self.road_owner[road_id] = player
+        self.player_road_bits[player] |= 1 << road_id
+        self._link_road(road_id, player)
+        self._candidate_road_nodes[player].update(self._nodes_listing_road[road_id])
+        self._legal_cache.clear()
+        self.topology_version += 1
     
 
     # --- Query ---
 
-    def get_production_for_roll(self, dice_roll: int) -> List[Tuple[int, str]]:
+    def get_production_for_roll(self, dice_roll: int) -> Dict[Tuple[int, int], int]:
         """
         Get a mapping of player to resources produced for a given dice roll.
-        Returns a list of tuples (player, resource).
+        Returns a dict {(player, resource index): count}, see RESOURCES.
 
-        for each hex, that the dice number matches the dice roll:
-        - for each node around the hex:
+        for each node around a hex whose dice number matches the dice roll
+        (looked up in the topology's roll table):
             - if occupied by a settlement, give 1 resource to the player
             - if occupied by a city, give 2 resources to the player
         """
-        production: List[Tuple[int, str]] = []
-        for hex_tile in self.hexes.values(): # check each hex
-            if hex_tile.dice_number != dice_roll:
-                continue  
-            for node_id in hex_tile.nodes: # check each node around the hex
-                node = self.nodes[node_id]
-                if node.occupant == 0: # unoccupied, exit for loop
-                    continue  # unoccupied
-                resource = hex_tile.resource
-                if node.occupant in [1, 2]:  # settlement
-                    production.append((node.occupant, resource))
-                elif node.occupant in [3, 4]:  # city
-                    production.append((node.occupant - 2, resource))  # city produces 2 resources
-                    production.append((node.occupant - 2, resource))
-                    
+        production: Dict[Tuple[int, int], int] = {}
+        node_occupant = self.node_occupant
+        nodes = self._roll_to_nodes.get(dice_roll, ())
+        resources = self._roll_to_resource.get(dice_roll, ())
+        for node_id, resource in zip(nodes, resources): # each node around a producing hex
+            occupant = node_occupant[node_id]
+            if occupant == 0:
+                continue  # unoccupied
+            if occupant < 3:  # settlement (1, 2)
+                key = (occupant, resource)
+                production[key] = production.get(key, 0) + 1
+            else:  # city (3, 4)
+                key = (occupant - 2, resource)
+                production[key] = production.get(key, 0) + 2  # city produces 2 resources
+
         return production
     
-    def get_available_actions(self, player: int):
+    def get_available_actions(self, player: int, include: Optional[Iterable[str]] = None):
         """
         Enumerate all available actions for the given player.
+        If include is given, only those action types are enumerated.
         """
-        actions = {
-            "build_settlement": self.list_legal_settlement_spots(player, False),
-            "build_city": self.list_legal_city_spots(player),
-            "build_road": self.list_legal_road_spots(player),
-        }
+        actions = {}
+        if include is None or "build_settlement" in include:
+            actions["build_settlement"] = self.list_legal_settlement_spots(player, False)
+        if include is None or "build_city" in include:
+            actions["build_city"] = self.list_legal_city_spots(player)
+        if include is None or "build_road" in include:
+            actions["build_road"] = self.list_legal_road_spots(player)
         return actions
 
     # --- Utility ---
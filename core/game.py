@@ -1,11 +1,30 @@
 # core/game.py
 
 import random
-from typing import List, Dict
+from enum import IntEnum
+from typing import Dict, Iterable, Optional, Tuple, Union
 
-from .board import Board
-from .player import Player, MAX_VILLAGES, MAX_CITIES, MAX_ROADS
+from .board import Board, RESOURCES, RESOURCE_INDEX
+from .player import Player, SETTLEMENTS, CITIES, ALL_CAPS
 
+DICE_POOL_SIZE = 4096  # number of dice pairs drawn from the RNG at once (a few less after rejection)
+# random bytes map to die faces with bytes.translate: 0..251 -> b % 6 + 1, 252..255 are
+# dropped so every face stays equally likely (252 = 42 * 6)
+_DIE_FROM_BYTE = bytes(b % 6 + 1 for b in range(256))
+_DIE_REJECT = bytes(range(252, 256))
+
+
+class Action(IntEnum):
+    """Action types accepted by Game.advance_one_action, also used to index its dispatch table."""
+    START_TURN = 0
+    BUILD_SETTLEMENT = 1
+    BUILD_CITY = 2
+    BUILD_ROAD = 3
+    END_TURN = 4
+    TRADE_BANK = 5
+
+# the string names advance_one_action used to take, still accepted
+ACTION_BY_NAME: Dict[str, Action] = {action.name.lower(): action for action in Action}
 
 
 class Game:
@@ -18,14 +37,31 @@ class Game:
     manages itself, dictates the game, board and player interactions.
     """
 
+    __slots__ = (
+        "board", "p1", "p2", "_players",
+        "current_player_id", "current_player", "turn_number", "last_roll", "last_sevens",
+        "_dice_pool", "_dice_idx",
+        "initial_buildings_placed",
+        "longest_road_owner", "longest_road_length", "_lr_cache",
+        "finished", "winner",
+        "state_version",
+    )
+
     def __init__(self, board: Board, p1: Player, p2: Player):
         self.board = board
         self.p1 = p1
         self.p2 = p2
+        self._players = (None, p1, p2)  # indexed by player id
         
         self.current_player_id = 1  # Player 1 starts
+        self.current_player: Player = p1  # always get_player(current_player_id), kept in sync by switch_player
         self.turn_number = 0
-        self.last_roll: List[tuple[int, int]] = []  # stores last dice roll(s), including re-rolls when 7s
+        self.last_roll: Optional[Tuple[int, int]] = None  # last non-7 dice pair, None before the first roll
+        self.last_sevens: Tuple[Tuple[int, int], ...] = ()  # the 7s re-rolled right before last_roll
+        # pre-drawn die faces, consumed two at a time by roll_dice; filled on first roll
+        # so that random.seed() called after creating the game still applies
+        self._dice_pool: bytes = b""
+        self._dice_idx = 0
 
         self.initial_buildings_placed = { # track initial placements - turn_number: [village_placed, road_placed]
             0: [False, False], 
@@ -36,41 +72,68 @@ class Game:
         # longest road tracking
         self.longest_road_owner = 0 # 0 if no one, 1 if p1, 2 if p2
         self.longest_road_length = 5  # Minimum length to claim longest road
+        self._lr_cache: Dict[int, tuple] = {} # player_id: (board.topology_version, longest road length)
 
         # win condition
         self.finished = False
         self.winner = 0  # 0 if tie, 1 if p1, 2 if p2
 
+        # bumped by every advance_one_action call, lets callers cache get_ui_state()
+        self.state_version = 0
+
 
     ### basic helper methods ###
     def get_player(self, player_id: int) -> Player:
-        return self.p1 if player_id == 1 else self.p2
+        return self._players[player_id]
     
+    def is_free_placement(self, kind: int) -> bool:
+        """
+        Whether the next settlement (kind 0) or road (kind 1) of the current
+        turn is a free initial placement, i.e. the setup one hasn't been built yet.
+        """
+        return self.turn_number < 4 and not self.initial_buildings_placed[self.turn_number][kind]
+
     def switch_player(self):
-        self.current_player_id = 2 if self.current_player_id == 1 else 1
+        self.current_player_id ^= 3  # 1 <-> 2
+        self.current_player = self._players[self.current_player_id]
 
     ### dice rolling and production ###
-    def roll_dice(self) -> list[tuple[int, int]]:
-        die1 = random.randint(1, 6)
-        die2 = random.randint(1, 6)
-        
-        # if 7, append to return and roll again
-        if die1 + die2 == 7:
-            return [(die1, die2)] + self.roll_dice()
-        else:
-            return [(die1, die2)]
+    def roll_dice(self) -> Tuple[int, int, int]:
+        """
+        Roll two dice, re-rolling on every 7.
+        Returns (die1, die2, number of 7s rolled before them);
+        the 7 pairs themselves are left in self.last_sevens.
+        """
+        pool = self._dice_pool
+        idx = self._dice_idx
+        sevens = ()
+
+        # if 7, remember it and roll again
+        while True:
+            if idx + 1 >= len(pool):
+                pool = self._dice_pool = random.randbytes(2 * DICE_POOL_SIZE).translate(_DIE_FROM_BYTE, _DIE_REJECT)
+                idx = 0
+            die1 = pool[idx]
+            die2 = pool[idx + 1]
+            idx += 2
+            if die1 + die2 != 7:
+                self._dice_idx = idx
+                self.last_sevens = sevens
+                return die1, die2, len(sevens)
+            sevens += ((die1, die2),)
         
-    def distribute_resources(self, roll: List[tuple[int, int]]):
-        ## sums the last roll (because it's the only one non-7)
-        total = roll[-1][0] + roll[-1][1] 
-    
-        production_events = self.board.get_production_for_roll(total)
-        for player_id, resource in production_events:
-            self.get_player(player_id).add_resource(resource)
+    def distribute_resources(self, die1: int, die2: int):
+        production_events = self.board.get_production_for_roll(die1 + die2)
+        if not production_events:
+            return
+        # write straight into the resource lists, indexed by player id
+        resources = (None, self.p1.resources, self.p2.resources)
+        for (player_id, resource), count in production_events.items():
+            resources[player_id][resource] += count
 
     def handle_bank_trade(self, player: Player, to_receive: str, to_give: str, cost: int) -> bool:
-        player.resources[to_give] -= cost
-        player.resources[to_receive] += 1
+        player.resources[RESOURCE_INDEX[to_give]] -= cost
+        player.resources[RESOURCE_INDEX[to_receive]] += 1
         return True
 
     #############################    
@@ -82,53 +145,47 @@ class Game:
 
         if self.turn_number >= 4:
             # roll dice and distribute resources
-            roll = self.roll_dice()
-            self.distribute_resources(roll)
-            self.last_roll = roll # store for UI display
+            die1, die2, _ = self.roll_dice()
+            self.distribute_resources(die1, die2)
+            self.last_roll = (die1, die2) # store for UI display
 
         
 
-        current_player = self.get_player(self.current_player_id)
-
-        
 
-
-    def perform_build_action(self, action_type: str, target_id: int) -> bool:
+    def perform_build_action(self, action_type: Union[Action, str], target_id: int) -> bool:
         """
         Game calls this to have the current player attempt build something.
         Returns True if successful, False otherwise.
         """
-        current_player = self.get_player(self.current_player_id)
-
-        if action_type == "build_settlement":
-            if self.turn_number < 4:
-                free_village = self.initial_buildings_placed[self.turn_number][0] == False
-            else:
-                free_village = False
-            success = current_player.build_settlement(self.board, target_id, free_village)
-            if self.turn_number < 4:
-                self.initial_buildings_placed[self.turn_number][0] = success 
-        elif action_type == "build_city":
-            success = current_player.build_city(self.board, target_id)
-        elif action_type == "build_road":
-            if self.turn_number < 4:
-                free_road = self.initial_buildings_placed[self.turn_number][1] == False
-            else:
-                free_road = False
-            success = current_player.build_road(self.board, target_id, free_road)
-            if self.turn_number < 4:
-                self.initial_buildings_placed[self.turn_number][1] = success
-        else:
-            success = False  # unknown action
+        if isinstance(action_type, str):
+            action_type = ACTION_BY_NAME.get(action_type, -1)
+
+        if action_type == Action.BUILD_SETTLEMENT:
+            return self._build_settlement(target_id)
+        if action_type == Action.BUILD_CITY:
+            return self.current_player.build_city(self.board, target_id)
+        if action_type == Action.BUILD_ROAD:
+            return self._build_road(target_id)
+        return False  # unknown action
+
+    def _build_settlement(self, node_id: int) -> bool:
+        success = self.current_player.build_settlement(self.board, node_id, self.is_free_placement(0))
+        if self.turn_number < 4:
+            self.initial_buildings_placed[self.turn_number][0] = success
+        return success
 
+    def _build_road(self, road_id: int) -> bool:
+        success = self.current_player.build_road(self.board, road_id, self.is_free_placement(1))
+        if self.turn_number < 4:
+            self.initial_buildings_placed[self.turn_number][1] = success
         return success
     
 
     ### win condition and scoring ###
     def calculate_victory_points(self, player: Player) -> int:
         points = 0
-        points += player.built["settlements"]  # 1 point each
-        points += player.built["cities"] * 2   # 2 points each
+        points += player.built[SETTLEMENTS]  # 1 point each
+        points += player.built[CITIES] * 2   # 2 points each
 
         # longest road
         if self.longest_road_owner == player.id:
@@ -136,36 +193,14 @@ class Game:
 
         return points
     
-    def update_longest_road(self):
-        """
-        Check both players' longest roads and update the game state if needed.
-        """
-        p1_road_length = self.board.calculate_longest_road(self.p1.id)
-        p2_road_length = self.board.calculate_longest_road(self.p2.id)
-
-        if p1_road_length >= self.longest_road_length and p1_road_length > p2_road_length:
-            self.longest_road_owner = 1
-            self.longest_road_length = p1_road_length
-        elif p2_road_length >= self.longest_road_length and p2_road_length > p1_road_length:
-            self.longest_road_owner = 2
-            self.longest_road_length = p2_road_length
-        # if tie or neither exceeds current longest, no change
-    
     def check_win_condition(self):
         """
         Game ends when a player maxes all 3 structures
         Winner = whoever has more points at that time
         """
 
-        def is_finished(p: Player) -> bool:
-            return (
-                p.built["settlements"] >= MAX_VILLAGES and
-                p.built["cities"] >= MAX_CITIES and
-                p.built["roads"] >= MAX_ROADS
-            )
-        
-        p1_finished = is_finished(self.p1)
-        p2_finished = is_finished(self.p2)
+        p1_finished = self.p1.caps_reached == ALL_CAPS
+        p2_finished = self.p2.caps_reached == ALL_CAPS
 
         if not (p1_finished or p2_finished):
             return  # game continues
@@ -185,19 +220,20 @@ class Game:
 
 
     ### main single turn execution ###
-    def advance_one_action(self, action_type: str, target_id = -1):
+    def advance_one_action(self, action_type: Union[Action, str], target_id = -1):
         """
         External interface to advance the game by exactly one action.
 
         Human UI or AI agent calls
         game.advance_one_action(action_type, target_id).
-        example: game.advance_one_action("build_settlement", node_id)
+        example: game.advance_one_action(Action.BUILD_SETTLEMENT, node_id)
 
-        action type is "start_turn" for starting the turn (rolling dice, distributing resources)
-        action_type is one of "build_settlement", "build_city", "build_road"
+        action_type is an Action (the lowercase names, e.g. "build_settlement", are accepted too)
+        Action.START_TURN for starting the turn (rolling dice, distributing resources)
+        Action.BUILD_SETTLEMENT, BUILD_CITY or BUILD_ROAD
         to attempt to perform that action on target_id.
-        action_type is "end_turn" for ending the turn and switching to the next player
-        action_type is "trade_bank" for trading with the bank, target_id is a tuple (offered_resource, wanted_resource, cost)
+        Action.END_TURN for ending the turn and switching to the next player
+        Action.TRADE_BANK for trading with the bank, target_id is a tuple (offered_resource, wanted_resource, cost)
 
         After something is built, check for win condition and end the game if met.
 
@@ -206,31 +242,64 @@ class Game:
         if self.finished:
             return False  # game already over
 
-        current_player = self.get_player(self.current_player_id)
-
-        success = False
-
-        if action_type == "start_turn":
-            self.turn_start()
-            success = True
-        elif action_type in {"build_settlement", "build_city", "build_road"}:
-            success = self.perform_build_action(action_type, target_id)
-            if success and action_type in {"build_road", "build_settlement"}:
-                self.update_longest_road()
-            if success:
-                self.check_win_condition() # also finishes the game if win condition met
-        elif action_type == "end_turn": # do not switch when the turn number is 1. turn order is P1, P2, P2, P1 for turns 0-3 to set up initial placements
-            if self.turn_number != 1:
-                self.switch_player()
-            success = True
-        elif action_type == "trade_bank":
-            to_receive, to_give, cost = target_id  # unpack tuple
-            success = self.handle_bank_trade(current_player, to_receive, to_give, cost)
-        else:
-            success = False  # unknown action
+        if isinstance(action_type, str):
+            action_type = ACTION_BY_NAME.get(action_type, -1)
+        # bool is an int subclass, but True is no action
+        if not isinstance(action_type, int) or type(action_type) is bool or not 0 <= action_type < len(self._ACTION_HANDLERS):
+            return False  # unknown action
+
+        self.state_version += 1
+        return self._ACTION_HANDLERS[action_type](self, target_id)
 
+    # --- action handlers, indexed by Action in _ACTION_HANDLERS ---
+
+    def _act_start_turn(self, target_id) -> bool:
+        self.turn_start()
+        return True
+
+    def _act_build_settlement(self, target_id) -> bool:
+        success = self._build_settlement(target_id)
+        if success:
+            self.update_longest_road()
+            # only the builder's caps can have changed, the game ends once they're all reached
+            if self.current_player.caps_reached == ALL_CAPS:
+                self.check_win_condition() # finishes the game
+        return success
+
+    def _act_build_city(self, target_id) -> bool:
+        success = self.current_player.build_city(self.board, target_id)
+        if success and self.current_player.caps_reached == ALL_CAPS:
+            self.check_win_condition()
+        return success
+
+    def _act_build_road(self, target_id) -> bool:
+        success = self._build_road(target_id)
+        if success:
+            self.update_longest_road()
+            if self.current_player.caps_reached == ALL_CAPS:
+                self.check_win_condition()
         return success
 
+    def _act_end_turn(self, target_id) -> bool:
+        # do not switch when the turn number is 1. turn order is P1, P2, P2, P1 for turns 0-3 to set up initial placements
+        if self.turn_number != 1:
+            self.switch_player()
+        return True
+
+    def _act_trade_bank(self, target_id) -> bool:
+        to_receive, to_give, cost = target_id  # unpack tuple
+        return self.handle_bank_trade(self.current_player, to_receive, to_give, cost)
+
+    # plain functions rather than bound methods, so games don't hold a reference cycle to themselves
+    _ACTION_HANDLERS = (
+        _act_start_turn,
+        _act_build_settlement,
+        _act_build_city,
+        _act_build_road,
+        _act_end_turn,
+        _act_trade_bank,
+    )
+
 
     ##### Longest Road Calculation #####
     
@@ -266,77 +335,64 @@ class Game:
 
     def _player_road_graph(self, player_id: int):
         """
-        Build adjacency list for player's road graph.
+        Adjacency list of the player's road graph: node -> [(node, edge bit), ...].
+        Maintained incrementally by the board as roads and settlements are built.
         Cannot pass THROUGH an opponent settlement.
         But roads touching a blocked node still count from the free endpoint.
         """
-        if player_id == 1:
-            blocked = {2, 4}   # opponent has 2 (settlement) or 4 (city)
-        else:
-            blocked = {1, 3}
-
-        adj = {}
-
-        for road in self.board.roads.values():
-            if road.owner != player_id:
-                continue
-
-            a, b = road.nodes
-            a_blocked = self.board.nodes[a].occupant in blocked
-            b_blocked = self.board.nodes[b].occupant in blocked
-
-            # Both ends blocked → unusable
-            if a_blocked and b_blocked:
-                continue
-
-            # If A is not blocked, add A → B
-            if not a_blocked:
-                adj.setdefault(a, []).append(b)
-
-            # If B is not blocked, add B → A
-            if not b_blocked:
-                adj.setdefault(b, []).append(a)
-
-        return adj
+        return self.board.player_road_adj[player_id]
     
 
-    def _dfs_longest_path(self, graph, current, visited_edges):
+    def _dfs_longest_path(self, graph, start, stack=None):
         """
-        DFS computing longest simple path through edges.
-        graph[node] = list of connected nodes.
-        visited_edges = set of (min(a,b), max(a,b)) tuples.
+        DFS computing longest simple path through edges, starting at start.
+        graph[node] = list of (connected node, edge bit) pairs, the bit being 1 << edge id.
+        Iterative, with the visited edges of each path kept as an int bitmask,
+        so no recursion and no set hashing.
+        stack = optional empty list to use as the DFS stack (it is empty again on return),
+        so repeated calls can share one allocation.
         """
         best = 0
+        if stack is None:
+            stack = []
+        stack.append((start, 0, 0))  # (node, visited_mask, path length)
 
-        for nxt in graph.get(current, []):
-            edge = (min(current, nxt), max(current, nxt))
-            if edge in visited_edges:
-                continue
-
-            visited_edges.add(edge)
-            length = 1 + self._dfs_longest_path(graph, nxt, visited_edges)
-            visited_edges.remove(edge)
-
+        while stack:
+            current, visited, length = stack.pop()
             if length > best:
                 best = length
 
+            for nxt, bit in graph.get(current, ()):
+                if visited & bit:
+                    continue
+                stack.append((nxt, visited | bit, length + 1))
+
         return best
     
 
     def _compute_longest_road_for_player(self, player_id: int) -> int:
+        # the result only depends on the board, reuse it until something gets built
+        version = self.board.topology_version
+        cached = self._lr_cache.get(player_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
         graph = self._player_road_graph(player_id)
 
         if not graph:
+            self._lr_cache[player_id] = (version, 0)
             return 0
 
         longest = 0
+        stack = []  # shared by every start, empty between runs
 
         # Try starting from every node in the player's graph
         for node in graph:
-            length = self._dfs_longest_path(graph, node, set())
+            length = self._dfs_longest_path(graph, node, stack)
             if length > longest:
                 longest = length
 
+        self._lr_cache[player_id] = (version, longest)
         return longest
 
 
@@ -344,7 +400,7 @@ class Game:
       
     ##### GAME STATE QUERY METHODS #####
     
-    def get_ui_state(self) -> Dict:
+    def get_ui_state(self, include: Optional[Iterable[str]] = None) -> Dict:
         """
         Return a JSON-serializable snapshot intended for the TUI.
         {
@@ -357,40 +413,41 @@ class Game:
             "available_roads_cp": [road_ids...],
             "available_cities_cp": [node_ids...],
             "available_trade_offers_cp": {offered_resource: [(wanted_resource, cost), ...], ...},
+            "victory_points_cp": int,
+            "victory_points_op": int,
         }
+        If include is given, only those keys are computed and returned.
         """
-        cp = self.p1 if self.current_player_id == 1 else self.p2
-        op = self.p2 if self.current_player_id == 1 else self.p1
+        def wanted(key: str) -> bool:
+            return include is None or key in include
+
+        cp = self.current_player
+        op = self._players[self.current_player_id ^ 3]
+
+        state = {}
+        if wanted("current_player_id"):
+            state["current_player_id"] = self.current_player_id
+        if wanted("turn_number"):
+            state["turn_number"] = self.turn_number
+        if wanted("last_rolls"):
+            state["last_rolls"] = [*self.last_sevens, self.last_roll] if self.last_roll else []
+        if wanted("resources_cp"):
+            state["resources_cp"] = dict(zip(RESOURCES, cp.resources))
+        if wanted("resources_op"):
+            state["resources_op"] = dict(zip(RESOURCES, op.resources))
 
         # fetch lists from players (pass board where needed)
-        if self.turn_number < 4:
-            free_village = self.initial_buildings_placed[self.turn_number][0] == False
-        else:
-            free_village = False
-
-        if self.turn_number < 4:
-            free_road = self.initial_buildings_placed[self.turn_number][1] == False
-        else:
-            free_road = False
-
-        av_v_cp = cp.get_available_settlement_spots(self.board, free_village)
-        av_r_cp = cp.get_available_road_spots(self.board, free_road)
-        av_c_cp = cp.get_available_city_spots(self.board)
-        av_to_cp = cp.get_available_trade_offers(self.board)
-
-
-        state = {
-            "current_player_id": self.current_player_id,
-            "turn_number": self.turn_number,
-            "last_rolls": list(self.last_roll),  # copy safe
-            "resources_cp": dict(cp.resources),
-            "resources_op": dict(op.resources),
-            "available_villages_cp": av_v_cp,
-            "available_roads_cp": av_r_cp,
-            "available_cities_cp": av_c_cp,
-            "available_trade_offers_cp": av_to_cp,
-            "victory_points_cp": self.calculate_victory_points(cp),
-            "victory_points_op": self.calculate_victory_points(op),
-        }
+        if wanted("available_villages_cp"):
+            state["available_villages_cp"] = cp.get_available_settlement_spots(self.board, self.is_free_placement(0))
+        if wanted("available_roads_cp"):
+            state["available_roads_cp"] = cp.get_available_road_spots(self.board, self.is_free_placement(1))
+        if wanted("available_cities_cp"):
+            state["available_cities_cp"] = cp.get_available_city_spots(self.board)
+        if wanted("available_trade_offers_cp"):
+            state["available_trade_offers_cp"] = cp.get_available_trade_offers(self.board)
+
+        if wanted("victory_points_cp"):
+            state["victory_points_cp"] = self.calculate_victory_points(cp)
+        if wanted("victory_points_op"):
+            state["victory_points_op"] = self.calculate_victory_points(op)
         return state
-
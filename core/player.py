@@ -1,83 +1,108 @@
-from typing import List, Dict, Set, Tuple, TYPE_CHECKING
+from typing import List, Dict, Set, Tuple
 
-from .board import Board
+from .board import Board, RESOURCES, BRICK, WOOD, SHEEP, WHEAT, ORE
 
-# Resource costs for convenience
+# Resource costs for convenience, keyed by resource index (see board.RESOURCES)
 SETTLEMENT_COST = {
-    "brick": 1,
-    "wood": 1,
-    "sheep": 1,
-    "wheat": 1
+    BRICK: 1,
+    WOOD: 1,
+    SHEEP: 1,
+    WHEAT: 1
 }
 
 CITY_COST = {
-    "wheat": 2,
-    "ore": 3
+    WHEAT: 2,
+    ORE: 3
 }
 
 ROAD_COST = {
-    "brick": 1,
-    "wood": 1
+    BRICK: 1,
+    WOOD: 1
 }
 
 MAX_VILLAGES, MAX_CITIES, MAX_ROADS = 5, 4, 15
 
+# indices into Player.built
+SETTLEMENTS, CITIES, ROADS = 0, 1, 2
+
+# bits of Player.caps_reached, set while the matching built count is at its MAX_*
+CAP_SETTLEMENTS, CAP_CITIES, CAP_ROADS = 1, 2, 4
+ALL_CAPS = CAP_SETTLEMENTS | CAP_CITIES | CAP_ROADS
+
 class Player:
     """
     Simple player model for both human and ai agents.
 
     Holds resources and performs actions that mutate the board state.
+    resources and built are flat lists of counts, indexed by the resource
+    index (BRICK..ORE) and by SETTLEMENTS/CITIES/ROADS respectively.
 
     The evolutionary agents will extend this class,
     (they will be calling these methods).
     """
 
+    # subclasses that don't declare their own __slots__ still get a __dict__ for extra state
+    __slots__ = (
+        "id", "resources", "built", "caps_reached",
+        "owned_settlements", "owned_cities", "owned_roads", "ports",
+    )
+
     def __init__(self, player_id: int):
         self.id = player_id
-        self.resources: Dict[str, int] = {
-            "brick": 0,
-            "wood": 0,
-            "sheep": 0,
-            "wheat": 0,
-            "ore": 0
-        }
-        self.built: Dict[str, int] = {
-            "settlements": 0,
-            "cities": 0,
-            "roads": 0
-        }
+        self.resources: List[int] = [0] * len(RESOURCES)  # brick, wood, sheep, wheat, ore
+        self.built: List[int] = [0, 0, 0]  # settlements, cities, roads
+        self.caps_reached: int = 0  # CAP_* bits for the structures maxed out, kept in sync with built
+        # ids of what the player owns, kept in sync by the build_* methods
+        self.owned_settlements: Set[int] = set()
+        self.owned_cities: Set[int] = set()
+        self.owned_roads: Set[int] = set()
         self.ports: Set[str] = set() # resource types for which the player has ports (e.g., "brick", "wood", or "generic" for 3:1 port)
 
     ## resource helpers
 
-    def add_resource(self, resource: str, amount: int = 1):
+    def add_resource(self, resource: int, amount: int = 1):
         self.resources[resource] += amount
 
-    def has_resources(self, cost: Dict[str, int]) -> bool:
-        return all(self.resources[r] >= amt for r, amt in cost.items())
+    def has_resources(self, cost: Dict[int, int]) -> bool:
+        resources = self.resources
+        for r, amt in cost.items():
+            if resources[r] < amt:
+                return False
+        return True
     
-    def deduct_resources(self, cost: Dict[str, int]):
+    def deduct_resources(self, cost: Dict[int, int]):
+        resources = self.resources
+        for r, amt in cost.items():
+            resources[r] -= amt
+
+    def try_spend(self, cost: Dict[int, int]) -> bool:
+        """Deduct cost if the player can afford it. Returns False (spending nothing) otherwise."""
+        resources = self.resources
         for r, amt in cost.items():
-            self.resources[r] -= amt
+            if resources[r] < amt:
+                return False
+        for r, amt in cost.items():
+            resources[r] -= amt
+        return True
 
     ## legality checkings
 
     def can_build_settlement(self, board: Board, node_id: int, free_settlement: bool) -> bool:  
-        if self.built["settlements"] >= MAX_VILLAGES:
+        if self.caps_reached & CAP_SETTLEMENTS:
             return False
         if not board.settlement_is_legal(node_id, self.id, free_settlement):
             return False
         return self.has_resources(SETTLEMENT_COST) if not free_settlement else True
     
     def can_build_city(self, board: Board, node_id: int) -> bool:
-        if self.built["cities"] >= MAX_CITIES:
+        if self.caps_reached & CAP_CITIES:
             return False
         if not board.city_is_legal(node_id, self.id):
             return False
         return self.has_resources(CITY_COST)
 
     def can_build_road(self, board: Board, road_id: int, free_road: bool) -> bool:
-        if self.built["roads"] >= MAX_ROADS:
+        if self.caps_reached & CAP_ROADS:
             return False
         if not board.road_is_legal(road_id, self.id):
             return False
@@ -87,15 +112,19 @@ class Player:
 
     def build_settlement(self, board: Board, node_id: int, free_settlement: bool) -> bool:
         # this theoretically shouldn't happen, but just in case (this method is called only for legal node_ids, if none, it won't be called)
-        if not self.can_build_settlement(board, node_id, free_settlement): 
+        if self.caps_reached & CAP_SETTLEMENTS:
+            return False
+        if not board.settlement_is_legal(node_id, self.id, free_settlement):
+            return False
+        if not free_settlement and not self.try_spend(SETTLEMENT_COST):
             return False
-
-        if not free_settlement:
-            self.deduct_resources(SETTLEMENT_COST)
 
         board.set_settlement(node_id, self.id)
 
-        self.built["settlements"] += 1
+        self.built[SETTLEMENTS] += 1
+        if self.built[SETTLEMENTS] >= MAX_VILLAGES:
+            self.caps_reached |= CAP_SETTLEMENTS
+        self.owned_settlements.add(node_id)
 
         port = board.nodes[node_id].port
         if port != "none":
@@ -106,30 +135,42 @@ class Player:
     
     def build_city(self, board: Board, node_id: int) -> bool:
         # this theoretically shouldn't happen, but just in case (this method is called only for legal node_ids, if none, it won't be called)
-        if not self.can_build_city(board, node_id):
+        if self.caps_reached & CAP_CITIES:
+            return False
+        if not board.city_is_legal(node_id, self.id):
+            return False
+        if not self.try_spend(CITY_COST):
             return False
-        
-        self.deduct_resources(CITY_COST)
 
         board.set_city(node_id, self.id)
 
-        self.built["cities"] += 1
-        self.built["settlements"] -= 1
+        self.built[CITIES] += 1
+        self.built[SETTLEMENTS] -= 1
+        if self.built[CITIES] >= MAX_CITIES:
+            self.caps_reached |= CAP_CITIES
+        if self.built[SETTLEMENTS] < MAX_VILLAGES:
+            self.caps_reached &= ~CAP_SETTLEMENTS
+        self.owned_settlements.discard(node_id)
+        self.owned_cities.add(node_id)
 
         return True
     
 
     def build_road(self, board: Board, road_id: int, free_road: bool) -> bool:
         # this theoretically shouldn't happen, but just in case (this method is called only for legal node_ids, if none, it won't be called)
-        if not self.can_build_road(board, road_id, free_road):
+        if self.caps_reached & CAP_ROADS:
+            return False
+        if not board.road_is_legal(road_id, self.id):
+            return False
+        if not free_road and not self.try_spend(ROAD_COST):
             return False
-
-        if not free_road:
-            self.deduct_resources(ROAD_COST)
 
         board.set_road(road_id, self.id)
 
-        self.built["roads"] += 1
+        self.built[ROADS] += 1
+        if self.built[ROADS] >= MAX_ROADS:
+            self.caps_reached |= CAP_ROADS
+        self.owned_roads.add(road_id)
 
         return True
     
@@ -138,18 +179,18 @@ class Player:
 
 
     def get_available_settlement_spots(self, board: Board, free_settlement: bool) -> List[int]:
-        if self.built["settlements"] >= MAX_VILLAGES:
+        if self.caps_reached & CAP_SETTLEMENTS:
             return []
         return board.list_legal_settlement_spots(self.id, free_settlement) if self.has_resources(SETTLEMENT_COST) or free_settlement else []
 
 
     def get_available_city_spots(self, board: Board) -> List[int]:
-        if self.built["cities"] >= MAX_CITIES:
+        if self.caps_reached & CAP_CITIES:
             return []
         return board.list_legal_city_spots(self.id) if self.has_resources(CITY_COST) else []
 
     def get_available_road_spots(self, board: Board, free_road: bool) -> List[int]:
-        if self.built["roads"] >= MAX_ROADS:
+        if self.caps_reached & CAP_ROADS:
             return []
         return board.list_legal_road_spots(self.id) if self.has_resources(ROAD_COST) or free_road else []
     
@@ -162,10 +203,9 @@ class Player:
             ...
         }
         """
-        resources = ["brick", "wood", "sheep", "wheat", "ore"]
         offers = {}
         rates = {}
-        for res in resources:
+        for res in RESOURCES:
             if res in self.ports:
                 rates[res] = 2
             elif "generic" in self.ports:
@@ -173,12 +213,12 @@ class Player:
             else:
                 rates[res] = 4
         # build offers
-        for resource_to_get in resources:
-            for resource_to_give in resources:
+        for resource_to_get in RESOURCES:
+            for give_idx, resource_to_give in enumerate(RESOURCES):
                 if resource_to_get == resource_to_give:
                     continue
                 rate = rates[resource_to_give]
-                if self.resources[resource_to_give] >= rate:
+                if self.resources[give_idx] >= rate:
                     if resource_to_get not in offers:
                         offers[resource_to_get] = []
                     offers[resource_to_get].append((resource_to_give, rate))
@@ -187,25 +227,13 @@ class Player:
 
 
     def get_owned_settlements(self, board: Board):
-        return [
-            n.id 
-            for n in board.nodes.values() 
-            if n.occupant == self.id 
-        ]
+        return sorted(self.owned_settlements)
     
     def get_owned_cities(self, board: Board):
-        return [
-            n.id 
-            for n in board.nodes.values() 
-            if n.occupant == self.id + 2
-        ]
+        return sorted(self.owned_cities)
     
     def get_owned_roads(self, board: Board):
-        return [
-            r.id 
-            for r in board.roads.values() 
-            if r.owner == self.id
-        ]
+        return sorted(self.owned_roads)
     
     def get_owned_ports(self, board: Board):
         return list(self.ports)
\ No newline at end of file
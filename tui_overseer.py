@@ -2,24 +2,99 @@
 import curses
 import curses.panel
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from core.board import Board
 from core.player import Player
-from core.game import Game
+from core.game import Game, Action
 
 
-# --- small utility to center a windowed slice with sel_index in middle when possible
-def centered_window(lst, sel_index, width=5):
-    n = len(lst)
+# --- small utility to center a window of indices with sel_index in middle when possible
+def centered_window_range(n, sel_index, width=5):
+    """(start, end) indices of the window over a list of length n."""
     if n == 0:
-        return [], 0
+        return 0, 0
     half = width // 2
     start = max(0, sel_index - half)
     end = start + width
     if end > n:
         end = n
         start = max(0, end - width)
-    return lst[start:end], start
+    return start, end
+
+
+# --- die faces for the dice panel, rendered once: value -> the 5 lines of the die
+def _render_die(pips):
+    # pips = (row, col) pip positions inside the 3×3 inner area
+    lines = ["┌───────┐"]
+    for r in range(3):
+        lines.append("│" + "".join(" ●" if (r, c) in pips else "  " for c in range(3)) + " │")
+    lines.append("└───────┘")
+    return tuple(lines)
+
+DIE_FACE_LINES = {
+    value: _render_die(pips)
+    for value, pips in {
+        1: {(1, 1)},
+        2: {(0, 0), (2, 2)},
+        3: {(0, 0), (1, 1), (2, 2)},
+        4: {(0, 0), (0, 2), (2, 0), (2, 2)},
+        5: {(0, 0), (0, 2), (1, 1), (2, 0), (2, 2)},
+        6: {(0, 0), (0, 2), (1, 0), (1, 2), (2, 0), (2, 2)},
+    }.items()
+}
+# a roll's two dice side by side, so each of the 5 lines goes out as one string
+DIE_PAIR_LINES = {
+    (d1, d2): tuple(line1 + line2 for line1, line2 in zip(DIE_FACE_LINES[d1], DIE_FACE_LINES[d2]))
+    for d1 in DIE_FACE_LINES
+    for d2 in DIE_FACE_LINES
+}
+
+
+# --- resource rows of the player panel: (resource, label, pip char), top to bottom
+RESOURCE_ROWS = (("wood", "Wood", "W"), ("brick", "Brick", "B"), ("wheat", "Wheat", "H"), ("sheep", "Sheep", "S"), ("ore", "Ore", "O"))
+RESOURCE_LINE_MAX = 20  # counts up to this have their row text prebuilt
+
+def _resource_line(label, char, count):
+    return f"{label}: " + " ".join(char * count)
+
+# resource -> row text for every count 0..RESOURCE_LINE_MAX, e.g. RESOURCE_LINES["wood"][3] = "Wood: W W W"
+RESOURCE_LINES = {
+    resource: tuple(_resource_line(label, char, count) for count in range(RESOURCE_LINE_MAX + 1))
+    for resource, label, char in RESOURCE_ROWS
+}
+
+
+# --- map road shapes: the braille chars of a road's map cells, keyed NN1, NN2, NN3 in the layout
+_ROAD_CHARS_FALLING = ("⠋", "⢀", "⡤")
+_ROAD_CHARS_VERTICAL = ("⡇",)
+_ROAD_CHARS_RISING = ("⢤", "⡀", "⠙")
+_FALLING_ROADS = frozenset((69,71,43,67,28,12,31,65,26,5,7,32,38,10,2,17,50,37,21,19,52,58,56,54))
+_VERTICAL_ROADS = frozenset((68,41,30,45,66,27,6,14,47,64,52,4,1,16,62,23,9,18,51,60,36,35,53,25,49))
+
+def _road_chars(road_id):
+    if road_id in _FALLING_ROADS:
+        return _ROAD_CHARS_FALLING
+    if road_id in _VERTICAL_ROADS:
+        return _ROAD_CHARS_VERTICAL
+    return _ROAD_CHARS_RISING
+
+
+class _RowRecorder:
+    """
+    Stands in for a curses window while something is drawn to it:
+    keeps the addstr calls per row, in order, as (x, text, attr).
+    """
+    def __init__(self, h, w):
+        self.size = (h, w)
+        self.rows = [[] for _ in range(h)]
+
+    def getmaxyx(self):
+        return self.size
+
+    def addstr(self, y, x, text, attr):
+        self.rows[y].append((x, text, attr))
 
 
 class TuiOverseer:
@@ -38,6 +113,30 @@ class TuiOverseer:
 
     ACTION_ROWS = ["finish", "village", "road", "city", "trade_receive", "trade_give"]
 
+    # first 4 rows of the player panel: (label, selection key, ui state key of its option list)
+    ACTION_LABELS = (
+        ("Finish Turn:", "finish", None),
+        ("Build Village:", "village", "available_villages_cp"),
+        ("Build Road:", "road", "available_roads_cp"),
+        ("Build City:", "city", "available_cities_cp"),
+    )
+    # rows with a plain option list -> ui state key of that list
+    ROW_STATE_KEYS = {key: state_key for _, key, state_key in ACTION_LABELS if state_key is not None}
+    # build rows -> (action Enter performs on the selected option, kind of map item it highlights: 1 node, 2 road)
+    BUILD_ROWS = {
+        "village": (Action.BUILD_SETTLEMENT, 1),
+        "road": (Action.BUILD_ROAD, 2),
+        "city": (Action.BUILD_CITY, 1),
+    }
+
+    # getch timeout bounds (ms) while a game action runs on the worker
+    POLL_MIN_MS = 2
+    POLL_MAX_MS = 50
+
+    # keys whose repeats in the typeahead are folded into a single multi-step move
+    NAV_KEYS = frozenset((curses.KEY_UP, curses.KEY_DOWN, curses.KEY_LEFT, curses.KEY_RIGHT,
+                          ord('k'), ord('j'), ord('h'), ord('l')))
+
     def __init__(self, stdscr, game: Game):
         self.stdscr = stdscr
         self.game = game
@@ -55,8 +154,48 @@ class TuiOverseer:
         # which row (index into ACTION_ROWS) is currently highlighted
         self.selected_row = 0
 
+        # set whenever the screen needs redrawing, the main loop only draws then
+        self.dirty = True
+
+        # last game.get_ui_state() snapshot and the game.state_version it was taken at
+        self._ui_state_cache = None
+        self._ui_state_version = -1
+        # (ui state, its trade_receive options) for the last state asked about, see _receive_options
+        self._receive_options_cache = None
+
+        # game actions run on a worker thread so the UI keeps responding;
+        # _pending is the future of the running one (None when idle).
+        # while it runs the UI doesn't touch the game, only the cached snapshot
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending = None
+        self._poll_ms = self.POLL_MIN_MS  # getch timeout while _pending runs
+        # keys read but not handled yet; the ones after a key that started an action
+        # wait here until it finished, so they act on the state it left
+        self._key_queue = deque()
+
+        # one window per screen region (map, dice, player panel, footer), laid out by _layout_windows
+        self.screen_size = None
+        self.dice_win = self.player_win = self.footer_win = None
+        self.map_rect = (0, 0)  # visible (height, width) of the map region, in the top left corner
+        # region name -> inputs it was last drawn from; a region whose inputs didn't change is left as is
+        self.drawn_keys = {}
+        # the map is drawn into a pad sized to fit it and copied to the screen from there;
+        # the pad is redrawn when board.topology_version moves past _map_version,
+        # otherwise only the cells of the old and new highlight are repainted
+        self.map_pad = None
+        self._map_cells = []
+        self._map_cells_by_tag = {}
+        self._map_version = -1
+        self._map_highlight = None
+        # the map layout with only the road/node cells left to fill in, made on the first build
+        self._map_template_cells = None
+
         # curses init
         curses.curs_set(0)
+        self.stdscr.leaveok(True)  # cursor is hidden, don't spend output on placing it
+        # queued keys are handled before every draw, so doupdate needn't poll the input
+        # for typeahead (and cut a frame short) while it writes
+        curses.typeahead(-1)
         curses.start_color()
         curses.use_default_colors()
         curses.init_pair(1, curses.COLOR_WHITE, -1)   # default
@@ -79,11 +218,28 @@ class TuiOverseer:
         self.C_WHEAT = curses.color_pair(8) | curses.A_BOLD
         self.C_ORE = curses.color_pair(9) | curses.A_BOLD
 
+        # map glyphs, indexed by occupant code: node occupant -> (char, color), road owner -> color
+        self._node_glyph = (
+            ("•", self.C_DEFAULT),
+            ("X", self.C_P1), ("X", self.C_P2),  # settlements
+            ("@", self.C_P1), ("@", self.C_P2),  # cities
+        )
+        self._road_color = (self.C_DEFAULT, self.C_P1, self.C_P2)
+        # hex resource -> (char, color); port type index -> (char, color)
+        self._hex_glyph = {
+            "wood": ("↑", self.C_GRASS), "sheep": ("v", self.C_GRASS), "brick": ("■", self.C_BRICK),
+            "wheat": ("W", self.C_WHEAT), "ore": ("■", self.C_ORE),
+        }
+        self._port_glyph = (
+            ("G", self.C_DICE), ("B", self.C_BRICK), ("W", self.C_GRASS),
+            ("S", self.C_GRASS), ("W", self.C_WHEAT), ("O", self.C_ORE),
+        )
+
         # enable mouse events for scroll wheel if terminal supports it
         curses.mousemask(curses.ALL_MOUSE_EVENTS | curses.REPORT_MOUSE_POSITION)
 
-        # small delay for getch blocking behavior
-        self.stdscr.timeout(100)  # ms
+        # block in getch until there is input, nothing changes on screen without it
+        self.stdscr.timeout(-1)
 
     # safe index utility
     def _safe_index(self, lst, idx):
@@ -96,223 +252,556 @@ class TuiOverseer:
             return len(lst) - 1
         return idx  
 
+    def _state(self):
+        """
+        Current game UI state, fetched again only after the game was advanced.
+        While an action runs on the worker the last snapshot is returned as is.
+        """
+        if self._pending is None and self._ui_state_version != self.game.state_version:
+            self._ui_state_cache = self.game.get_ui_state()
+            self._ui_state_version = self.game.state_version
+        return self._ui_state_cache
+
+    def _receive_options(self, state):
+        """The trade_receive row's options (the keys of available_trade_offers_cp), listed once per ui state."""
+        cached = self._receive_options_cache
+        if cached is None or cached[0] is not state:
+            cached = self._receive_options_cache = (state, list(state["available_trade_offers_cp"]))
+        return cached[1]
+
     # --- main loop ---
     def run(self):
-        while True:
-            self.draw()
-            key = self.stdscr.getch()
-            if key == -1:
-                continue
-
-            if key == ord('q'):
-                break
-
-            if key == curses.KEY_MOUSE:
-                try:
-                    _, mx, my, _, bstate = curses.getmouse()
-                except Exception:
-                    continue
-                # handle wheel: BUTTON4_PRESSED = wheel up, BUTTON5_PRESSED = wheel down
-                if bstate & curses.BUTTON4_PRESSED:
-                    self.on_left()
-                elif bstate & curses.BUTTON5_PRESSED:
-                    self.on_right()
-                continue
+        try:
+            while True:
+                self._collect_pending()
+                if not self._handle_queued_keys():
+                    break
+                if self.dirty:
+                    self.draw()
+                    self.dirty = False
+                # block until input, but poll while an action is running so its result shows up;
+                # the poll interval starts short and doubles, so a quick action shows right away
+                # and a long one costs few wakeups
+                if self._pending is None:
+                    self.stdscr.timeout(-1)
+                else:
+                    self.stdscr.timeout(self._poll_ms)
+                    self._poll_ms = min(2 * self._poll_ms, self.POLL_MAX_MS)
+                if not self._handle_input(self._getch()):
+                    break
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def _getch(self):
+        """getch, except that a mouse wheel event comes back as the key it acts like."""
+        key = self.stdscr.getch()
+        if key == curses.KEY_MOUSE:
+            try:
+                _, mx, my, _, bstate = curses.getmouse()
+            except curses.error:
+                return key
+            # BUTTON4_PRESSED = wheel up, BUTTON5_PRESSED = wheel down
+            if bstate & curses.BUTTON4_PRESSED:
+                return curses.KEY_LEFT
+            if bstate & curses.BUTTON5_PRESSED:
+                return curses.KEY_RIGHT
+        return key
+
+    def _handle_input(self, key) -> bool:
+        """
+        Queue key together with the keys that queued up meanwhile (e.g. a held
+        arrow key or a spun mouse wheel) and handle them before drawing again,
+        so a burst costs one redraw.
+        Returns False when one of them asks to quit.
+        """
+        if key == -1:
+            return True
+        keys = self._key_queue
+        keys.append(key)
+        self.stdscr.nodelay(True)
+        try:
+            key = self._getch()
+            while key != -1:
+                keys.append(key)
+                key = self._getch()
+        finally:
+            self.stdscr.nodelay(False)
+        return self._handle_queued_keys()
+
+    def _handle_queued_keys(self) -> bool:
+        """
+        Handle the queued keys in order, a run of the same navigation key as one
+        move of that many steps. Stops as soon as a game action is running: the
+        rest stay queued until run() has collected its result.
+        Returns False when one of them asks to quit.
+        """
+        keys = self._key_queue
+        while keys and self._pending is None:
+            key = keys.popleft()
+            count = 1
+            if key in self.NAV_KEYS:
+                while keys and keys[0] == key:
+                    keys.popleft()
+                    count += 1
+            if not self.handle_key(key, count):
+                return False
+        return True
+
+    # --- game actions ---
+    def _advance(self, *steps):
+        """Run (action, target) steps on the game in order, on the worker thread."""
+        self._pending = self._executor.submit(self._run_steps, steps)
+        self._poll_ms = self.POLL_MIN_MS
+        self.dirty = True
+
+    def _run_steps(self, steps):
+        for action, target in steps:
+            self.game.advance_one_action(action, target)
+
+    def _collect_pending(self):
+        """Pick up a finished action: re-raise its error if any and refresh the ui state."""
+        if self._pending is None or not self._pending.done():
+            return
+        pending, self._pending = self._pending, None
+        pending.result()
+        self.dirty = True
 
-            # navigation keys
-            if key in (curses.KEY_UP, ord('k')):
-                self.on_up()
-            elif key in (curses.KEY_DOWN, ord('j')):
-                self.on_down()
-            elif key in (curses.KEY_LEFT, ord('h')):
-                self.on_left()
-            elif key in (curses.KEY_RIGHT, ord('l')):
-                self.on_right()
-            elif key in (10, 13, curses.KEY_ENTER):
-                self.on_enter()
-            # ignore others
+    def handle_key(self, key, count: int = 1) -> bool:
+        """
+        Apply one key press (count times in a row for the NAV_KEYS).
+        Returns False when the key asks to quit.
+        """
+        if key == -1:
+            return True
+
+        # ncurses installs its own SIGWINCH handler, which interrupts the blocking
+        # getch with KEY_RESIZE; a handler of our own would replace it and
+        # curses would stop tracking the terminal size
+        if key == curses.KEY_RESIZE:
+            self.dirty = True
+            return True
+
+        if key == ord('q'):
+            return False
+
+        # navigation keys
+        if key in (curses.KEY_UP, ord('k')):
+            self.on_up(count)
+        elif key in (curses.KEY_DOWN, ord('j')):
+            self.on_down(count)
+        elif key in (curses.KEY_LEFT, ord('h')):
+            self.on_left(steps=count)
+        elif key in (curses.KEY_RIGHT, ord('l')):
+            self.on_right(steps=count)
+        elif key in (10, 13, curses.KEY_ENTER):
+            self.on_enter()
+        # ignore others (mouse events other than the wheel included, see _getch)
+        return True
 
     # --- navigation actions ---
-    def on_up(self):
-        self.selected_row = max(0, self.selected_row - 1)
-
-    def on_down(self):
-        self.selected_row = min(len(self.ACTION_ROWS) - 1, self.selected_row + 1)
-
-    def on_left(self):
-        """Scroll left for active player's current row's selection"""
-        state = self.game.get_ui_state()
-        active = state["current_player_id"]
-        row = self.ACTION_ROWS[self.selected_row]
-        if row == "village":
-            lst = state["available_villages_cp"]
-            idx = self._safe_index(lst, self.selection[active]["village"])
-            self.selection[active]["village"] = self._safe_index(lst, idx - 1)
-        elif row == "road":
-            lst = state["available_roads_cp"]
-            idx = self._safe_index(lst, self.selection[active]["road"])
-            self.selection[active]["road"] = self._safe_index(lst, idx - 1)
-        elif row == "city":
-            lst = state["available_cities_cp"]
-            idx = self._safe_index(lst, self.selection[active]["city"])
-            self.selection[active]["city"] = self._safe_index(lst, idx - 1)
-        elif row == "trade_receive":
-            trade_offers = state["available_trade_offers_cp"]
-            lst = list(trade_offers.keys())
-            idx = self._safe_index(lst, self.selection[active]["trade_receive"])
-            self.selection[active]["trade_receive"] = self._safe_index(lst, idx - 1)
-            lst_list = list(lst)
-            self.selected_resource_to_receive[active] = lst_list[self.selection[active]["trade_receive"]] if lst_list else None
-        elif row == "trade_give":
-            trade_offers = state["available_trade_offers_cp"]
-            # this ungodly statement builds a list of strings like "wood x2", "sheep x3", etc.
-            lst = [str(trade_offers[self.selected_resource_to_receive[active]][i][0]) + " x" + str(trade_offers[self.selected_resource_to_receive[active]][i][1]) for i in range(len(trade_offers[self.selected_resource_to_receive[active]]))] if trade_offers[self.selected_resource_to_receive[active]] else []
-            idx = self._safe_index(lst, self.selection[active]["trade_give"])
-            self.selection[active]["trade_give"] = self._safe_index(lst, idx - 1)
-
-    def on_right(self):
-        """Scroll right for active player's current row's selection"""
-        state = self.game.get_ui_state()
+    def on_up(self, steps: int = 1):
+        self.dirty = True
+        self.selected_row = max(0, self.selected_row - steps)
+
+    def on_down(self, steps: int = 1):
+        self.dirty = True
+        self.selected_row = min(len(self.ACTION_ROWS) - 1, self.selected_row + steps)
+
+    def on_left(self, state=None, steps: int = 1):
+        """Scroll left for active player's current row's selection (state = an already fetched ui state)"""
+        self.dirty = True
+        self._scroll(-steps, state if state is not None else self._state())
+
+    def on_right(self, state=None, steps: int = 1):
+        """Scroll right for active player's current row's selection (state = an already fetched ui state)"""
+        self.dirty = True
+        self._scroll(steps, state if state is not None else self._state())
+
+    def _scroll(self, step, state):
+        """Move the active player's selection in the current row by step, clamped to its options."""
         active = state["current_player_id"]
         row = self.ACTION_ROWS[self.selected_row]
-        if row == "village":
-            lst = state["available_villages_cp"]
-            idx = self._safe_index(lst, self.selection[active]["village"])
-            self.selection[active]["village"] = self._safe_index(lst, idx + 1)
-        elif row == "road": 
-            lst = state["available_roads_cp"]
-            idx = self._safe_index(lst, self.selection[active]["road"])
-            self.selection[active]["road"] = self._safe_index(lst, idx + 1)
-        elif row == "city":
-            lst = state["available_cities_cp"]
-            idx = self._safe_index(lst, self.selection[active]["city"])
-            self.selection[active]["city"] = self._safe_index(lst, idx + 1)
+        if row in self.ROW_STATE_KEYS:
+            lst = state[self.ROW_STATE_KEYS[row]]
         elif row == "trade_receive":
-            trade_offers = state["available_trade_offers_cp"]
-            lst = list(trade_offers.keys())
-            idx = self._safe_index(lst, self.selection[active]["trade_receive"])
-            self.selection[active]["trade_receive"] = self._safe_index(lst, idx + 1)
-            lst_list = list(lst)
-            self.selected_resource_to_receive[active] = lst_list[self.selection[active]["trade_receive"]] if lst_list else None
+            lst = self._receive_options(state)
         elif row == "trade_give":
-            trade_offers = state["available_trade_offers_cp"]
-            lst = [str(trade_offers[self.selected_resource_to_receive[active]][i][0]) + " x" + str(trade_offers[self.selected_resource_to_receive[active]][i][1]) for i in range(len(trade_offers[self.selected_resource_to_receive[active]]))] if trade_offers[self.selected_resource_to_receive[active]] else []
-            idx = self._safe_index(lst, self.selection[active]["trade_give"])
-            self.selection[active]["trade_give"] = self._safe_index(lst, idx + 1)
+            # offers for the resource picked in the trade_receive row (none picked -> nothing to scroll)
+            lst = state["available_trade_offers_cp"].get(self.selected_resource_to_receive[active]) or []
+        else:
+            return
+
+        selection = self.selection[active]
+        if lst:
+            # one clamp; a selection left past the end of a shrunk list counts as its last option
+            last = len(lst) - 1
+            selection[row] = max(0, min(min(selection[row], last) + step, last))
+        else:
+            selection[row] = 0
+        if row == "trade_receive":
+            self.selected_resource_to_receive[active] = lst[selection[row]] if lst else None
 
     def on_enter(self):
-        state = self.game.get_ui_state()
+        if self._pending is not None:
+            return  # previous action still running
+        self.dirty = True
+        state = self._state()
         active = state["current_player_id"]
         row = self.ACTION_ROWS[self.selected_row]
 
         if row == "finish":
-            self.game.advance_one_action("end_turn")
-            self.game.advance_one_action("start_turn")
+            self._advance((Action.END_TURN, -1), (Action.START_TURN, -1))
             # this is potentially the point where AI makes its move
             return
 
-        if row == "village":
-            lst = state["available_villages_cp"]
-            if not lst:
-                return
-            
-            idx = self._safe_index(lst, self.selection[active][row])
-            self.selection[active][row] = idx
-            target = lst[idx]
-
-            self.game.advance_one_action("build_settlement", target)
-
-        elif row == "road":
-            lst = state["available_roads_cp"]
-            if not lst:
-                return
-            
-            idx = self._safe_index(lst, self.selection[active][row])
-            self.selection[active][row] = idx
-            target = lst[idx]
-
-            self.game.advance_one_action("build_road", target)
-
-        elif row == "city":
-            lst = state["available_cities_cp"]
+        selection = self.selection[active]
+        if row in self.BUILD_ROWS:
+            lst = state[self.ROW_STATE_KEYS[row]]
             if not lst:
                 return
 
-            idx = self._safe_index(lst, self.selection[active][row])
-            self.selection[active][row] = idx
-            target = lst[idx]
-            
-            self.game.advance_one_action("build_city", target)
+            idx = selection[row] = self._safe_index(lst, selection[row])
+            self._advance((self.BUILD_ROWS[row][0], lst[idx]))
 
         elif row == "trade_give":
-            trade_offers = state["available_trade_offers_cp"]
             resource_to_receive = self.selected_resource_to_receive[active]
-            if resource_to_receive is None:
-                return
-            lst = trade_offers[resource_to_receive] if trade_offers[resource_to_receive] else []
+            # offers for the resource picked in the trade_receive row (none picked or no longer offered -> nothing to do)
+            lst = state["available_trade_offers_cp"].get(resource_to_receive)
             if not lst:
                 return
 
-            idx = self._safe_index(lst, self.selection[active][row])
-            self.selection[active][row] = idx
+            idx = selection[row] = self._safe_index(lst, selection[row])
             resource_to_give, cost = lst[idx]
             cost = int(cost)    
 
-            self.game.advance_one_action("trade_bank", (resource_to_receive, resource_to_give, cost))
+            self._advance((Action.TRADE_BANK, (resource_to_receive, resource_to_give, cost)))
 
 
     # --- drawing ---
-    def draw(self):
-        self.stdscr.erase()
+    def _put(self, win, y, x, text, attr):
+        """
+        addstr clipped to the window: text past the right edge is cut off, with a '…'
+        in the last column so the cut shows, writes outside the window are dropped.
+        """
+        h, w = win.getmaxyx()
+        if not (0 <= y < h and 0 <= x < w):
+            return
+        if x + len(text) > w:
+            text = text[:w - x - 1] + "…"
+        if y == h - 1 and x + len(text) == w:
+            # curses writes the bottom right corner but then fails to move the cursor past it
+            try:
+                win.addstr(y, x, text, attr)
+            except curses.error:
+                pass
+            return
+        win.addstr(y, x, text, attr)
+
+    def _layout_windows(self):
+        """
+        (Re)create the region windows when the terminal size changed.
+        Top part = map, bottom part = dice (left eighth, but at least one die pair wide)
+        and player panel, last line = footer.
+        """
         max_y, max_x = self.stdscr.getmaxyx()
-        half_y = max_y // 2  
-        half_y += 5
+        if (max_y, max_x) == self.screen_size:
+            return
+        self.screen_size = (max_y, max_x)
+        self.drawn_keys = {}  # new windows start out blank
+
+        footer_y = max_y - 1
+        half_y = min(max_y // 2 + 5, footer_y)
+        bottom_h = max(1, footer_y - half_y)
+        # the dice are written at x + 1 (see draw_dice), so a pair needs one more column
+        dice_w = min(max_x, max(max_x // 8, 1 + len(DIE_PAIR_LINES[1, 1][0])))
+        self.stdscr.erase()
+        self.stdscr.noutrefresh()  # clear what was on screen before the resize
+        self.map_rect = (half_y, max_x)
+        try:
+            self.dice_win = curses.newwin(bottom_h, dice_w, half_y, 0)
+            self.player_win = curses.newwin(bottom_h, max(1, max_x - (dice_w + 1)), half_y, dice_w + 1)
+            self.footer_win = curses.newwin(1, max_x, footer_y, 0)
+            for win in (self.dice_win, self.player_win, self.footer_win):
+                win.leaveok(True)
+        except curses.error:
+            # terminal too small to hold the layout, draw() shows nothing until it grows
+            self.dice_win = self.player_win = self.footer_win = None
+
+    def draw(self):
+        """
+        Redraw the regions whose inputs changed, each into its own window and copied
+        to the virtual screen with noutrefresh; one doupdate then sends all of it.
+        """
+        self._draw_regions()
+        curses.doupdate()
 
-        state = self.game.get_ui_state()
+    def _draw_regions(self):
+        self._layout_windows()
+        if self.dice_win is None:
+            return
+        if self._pending is not None:
+            # the game is being advanced, leave the regions showing it as they are
+            self._draw_footer("Thinking…")
+            return
+
+        state = self._state()
 
         # determine highlighted map item
         highlight_id = None
         cp = state["current_player_id"]
         row = self.ACTION_ROWS[self.selected_row]
 
-        if row == "village":
-            lst = state["available_villages_cp"]
-            if lst:
-                highlight_id = (1,lst[self.selection[cp]["village"]])
-        elif row == "road":
-            lst = state["available_roads_cp"]
-            if lst:
-                highlight_id = (2,lst[self.selection[cp]["road"]])
-        elif row == "city":
-            lst = state["available_cities_cp"]
+        if row in self.BUILD_ROWS:
+            lst = state[self.ROW_STATE_KEYS[row]]
             if lst:
-                highlight_id = (1,lst[self.selection[cp]["city"]])
-
-        # top half = inline node map
-        self.draw_map(0, 0, half_y, max_x, highlight_id)
+                highlight_id = (self.BUILD_ROWS[row][1], lst[self.selection[cp][row]])
+
+        # regions whose inputs are the same as last time keep their window content
+        # top half = inline node map (only changes when something is built)
+        map_key = (self.game.board.topology_version, highlight_id)
+        if self.drawn_keys.get("map") != map_key:
+            rows = self.draw_map(highlight_id)
+            pad_h, pad_w = self.map_pad.getmaxyx()
+            map_h, map_w = self.map_rect
+            if "map" not in self.drawn_keys:
+                rows = (0, pad_h - 1)  # new windows: the screen below the map was cleared
+            if rows is not None and rows[0] < map_h:
+                # copy just the band of rows that was painted
+                top, bottom = rows[0], min(rows[1], pad_h - 1, map_h - 1)
+                self.map_pad.noutrefresh(top, 0, top, 0, bottom, min(pad_w, map_w) - 1)
+            self.drawn_keys["map"] = map_key
 
         # bottom half split: dice panel (left eighth), player panel (right 7/8)
-        dice_w = max_x // 8
-        self.draw_dice(half_y, 0, max_y - half_y, dice_w, state)
-        self.draw_player_panel(half_y, dice_w + 1, max_y - half_y, max_x - (dice_w + 1), state)
+        dice_key = tuple(state["last_rolls"])
+        if self.drawn_keys.get("dice") != dice_key:
+            self._draw_rows("dice", self.dice_win, self.draw_dice, state)
+            self.drawn_keys["dice"] = dice_key
 
-        # footer help
-        footer = "Arrows or hjkl to navigate — Enter to act — q to quit"
-        try:
-            self.stdscr.addstr(max_y - 1, max(0, (max_x - len(footer))//2), footer, self.C_DEFAULT)
-        except curses.error:
-            pass
+        if self.drawn_keys.get("player") != self._player_panel_key():
+            self._draw_rows("player", self.player_win, self.draw_player_panel, state)
+            # drawing clamps the selections, so take the key afterwards
+            self.drawn_keys["player"] = self._player_panel_key()
 
-        
+        # footer help
+        self._draw_footer("Arrows or hjkl to navigate — Enter to act — q to quit")
 
+    def _draw_rows(self, region, win, draw_fn, state):
+        """
+        Lay out a region with draw_fn(recorder, 0, 0, h, w, state) into a recorder
+        (the panel's columns overlap, so a region is always laid out as a whole), then
+        bring win up to date row by row with _repaint_row; nothing is erased.
+        """
+        h, w = win.getmaxyx()
+        rows = _RowRecorder(h, w)
+        draw_fn(rows, 0, 0, h, w, state)
+        last_rows = self.drawn_keys.get(region + "_rows")
+        for row_y, ops in enumerate(rows.rows):
+            self._repaint_row(win, row_y, last_rows[row_y] if last_rows is not None else None, ops)
+        win.noutrefresh()
+        self.drawn_keys[region + "_rows"] = rows.rows
+
+    def _repaint_row(self, win, y, old_ops, new_ops):
+        """
+        Bring row y of win from old_ops to new_ops ((x, text, attr) writes recorded
+        through _put for a window of win's size, so already clipped to it; old_ops
+        None when the row's content is unknown). The leading writes both
+        share are kept: the row is cleared from where the first differing write
+        starts and replayed from the first write that reaches past that point.
+        """
+        if old_ops == new_ops:
+            return
+        if old_ops is None:
+            first, clear_x = 0, 0
+        else:
+            first = 0
+            while first < len(old_ops) and first < len(new_ops) and old_ops[first] == new_ops[first]:
+                first += 1
+            if self._recolor_row(win, y, old_ops[first:], new_ops[first:]):
+                return
+            tail = old_ops[first:] + new_ops[first:]
+            clear_x = min(op[0] for op in tail)
+            # kept writes that run into the cleared part are replayed too, with all after them
+            for i, (op_x, text, _) in enumerate(new_ops[:first]):
+                if op_x + len(text) > clear_x:
+                    first = i
+                    break
+        h, w = win.getmaxyx()
+        if 0 <= y < h and 0 <= clear_x < w:
+            win.move(y, clear_x)
+            win.clrtoeol()
+        corner_row = (y == h - 1)
+        for op_x, text, attr in new_ops[first:]:
+            if corner_row and op_x + len(text) == w:
+                self._put(win, y, op_x, text, attr)  # bottom right corner, see _put
+            else:
+                win.addstr(y, op_x, text, attr)
 
-        self.stdscr.refresh()
+    def _recolor_row(self, win, y, old_tail, new_tail):
+        """
+        If old_tail and new_tail put the same characters in the same cells and only
+        the colors differ (a highlight moved within an unchanged list), chgat the
+        cells that changed color instead of rewriting the text.
+        Returns False, writing nothing, when any character differs.
+        """
+        old_cells = {}
+        for op_x, text, attr in old_tail:
+            for i, char in enumerate(text):
+                old_cells[op_x + i] = (char, attr)
+        new_cells = {}
+        for op_x, text, attr in new_tail:
+            for i, char in enumerate(text):
+                new_cells[op_x + i] = (char, attr)
+        if old_cells.keys() != new_cells.keys():
+            return False
+        changed = []
+        for x, (char, attr) in new_cells.items():
+            old_char, old_attr = old_cells[x]
+            if old_char != char:
+                return False
+            if old_attr != attr:
+                changed.append((x, attr))
+
+        changed.sort()
+        run_x = run_end = run_attr = None
+        for x, attr in changed:
+            if x == run_end and attr == run_attr:
+                run_end += 1
+                continue
+            if run_x is not None:
+                win.chgat(y, run_x, run_end - run_x, run_attr)
+            run_x, run_end, run_attr = x, x + 1, attr
+        if run_x is not None:
+            win.chgat(y, run_x, run_end - run_x, run_attr)
+        return True
+
+    def _draw_footer(self, footer):
+        """Center footer in the bottom line, unless it's already there."""
+        if self.drawn_keys.get("footer") == footer:
+            return
+        self.footer_win.erase()
+        self._put(self.footer_win, 0, max(0, (self.screen_size[1] - len(footer))//2), footer, self.C_DEFAULT)
+        self.footer_win.noutrefresh()
+        self.drawn_keys["footer"] = footer
 
-    def draw_map(self, y, x, h, w, highlight_id=None):
+    def _player_panel_key(self):
+        """
+        Everything draw_player_panel reads, as flat tuples so later changes don't alter it;
+        the ui state is identified by the game.state_version it was fetched at (see _state).
+        """
+        return (
+            self.selected_row,
+            tuple(tuple(sel.values()) for sel in self.selection.values()),
+            tuple(self.selected_resource_to_receive.values()),
+            self._ui_state_version,
+        )
+
+    def draw_map(self, highlight_id=None):
         """
         Draws the map character by character utilizing braille dots for edges and other characters for nodes.
+        The cells are laid out by _build_map_cells and written to self.map_pad. The layout
+        never moves a cell, so after the board changed only the cells that came out
+        different are written; a new highlight just repaints the cells involved.
+        Returns the (first, last) pad row written to, None if nothing was.
         """
         board = self.game.board
+        rows = None
+        if self._map_version != board.topology_version:
+            cells = self._build_map_cells()
+            old_cells = self._map_cells
+            self._map_cells = cells
+            self._map_cells_by_tag = {}
+            for cell in cells:
+                if cell[4] is not None:
+                    self._map_cells_by_tag.setdefault(cell[4], []).append(cell)
+
+            # one spare row and column, curses refuses to write the bottom right corner
+            pad_h = max(cell[0] for cell in cells) + 2
+            pad_w = max(cell[1] for cell in cells) + 2
+            if self.map_pad is None or self.map_pad.getmaxyx() != (pad_h, pad_w) or len(old_cells) != len(cells):
+                if self.map_pad is None or self.map_pad.getmaxyx() != (pad_h, pad_w):
+                    self.map_pad = curses.newpad(pad_h, pad_w)
+                    self.map_pad.leaveok(True)
+                self.map_pad.erase()
+                self._paint_map_cells(cells, None)
+                rows = (0, pad_h - 1)
+            else:
+                # changed cells, and the old highlight's cells which are painted in the highlight color
+                old_highlight = self._map_highlight
+                rows = self._paint_map_cells(
+                    [cell for cell, old in zip(cells, old_cells)
+                     if cell != old or (old_highlight is not None and cell[4] == old_highlight)],
+                    None)
+            self._map_version = board.topology_version
+            self._map_highlight = None
+
+        if highlight_id != self._map_highlight:
+            for painted in (self._paint_map_cells(self._map_cells_by_tag.get(self._map_highlight, ()), None),
+                            self._paint_map_cells(self._map_cells_by_tag.get(highlight_id, ()), self.C_HL)):
+                if painted is not None:
+                    rows = painted if rows is None else (min(rows[0], painted[0]), max(rows[1], painted[1]))
+            self._map_highlight = highlight_id
+        return rows
+
+    def _paint_map_cells(self, cells, color_override):
+        """
+        Write cells to the map pad in their own color, or in color_override if given.
+        The pad has a spare row and column, so no write can hit its bottom right corner.
+        Adjacent cells of the same color go out as one addstr.
+        Returns the (first, last) row written to, None for no cells.
+        """
+        if not cells:
+            return None
+        pad = self.map_pad
+        run_y = run_x = run_end = run_attr = None
+        run = []
+        for cell_y, cell_x, char, color, tag in cells:
+            attr = color_override or color
+            if cell_y == run_y and cell_x == run_end and attr == run_attr:
+                run.append(char)
+            else:
+                if run:
+                    pad.addstr(run_y, run_x, "".join(run), run_attr)
+                run_y, run_x, run_attr = cell_y, cell_x, attr
+                run = [char]
+            run_end = cell_x + 1
+        pad.addstr(run_y, run_x, "".join(run), run_attr)
+        return min(cell[0] for cell in cells), max(cell[0] for cell in cells)
+
+    def _build_map_cells(self):
+        """
+        Lay out the map for the current board as a list of
+        (y, x, char, color, tag) cells, tag being (1, node_id) or (2, road_id) for
+        the cells that draw_map highlights, None otherwise.
+        Only the road and node cells depend on the board state; the rest comes
+        straight from the template made once by _map_template.
+        """
+        board = self.game.board
+        road_owner = board.road_owner
+        node_occupant = board.node_occupant
+        road_color = self._road_color  # 0=empty, 1=p1, 2=p2
+        node_glyph = self._node_glyph
+
+        cells = []
+        for cell in self._map_template():
+            tag = cell[4]
+            if tag is None:
+                cells.append(cell)
+            elif tag[0] == 2:
+                cells.append((cell[0], cell[1], cell[2], road_color[road_owner[tag[1]]], tag))
+            else:
+                char, color = node_glyph[node_occupant[tag[1]]]
+                cells.append((cell[0], cell[1], char, color, tag))
+        return cells
+
+    def _map_template(self):
+        """
+        The map layout, made once per board: the cells of _build_map_cells with the
+        fixed parts (spaces, hexes, ports, road shapes) filled in, the road colors
+        left None and the node glyphs and colors left None.
+        """
+        if self._map_template_cells is not None:
+            return self._map_template_cells
+        board = self.game.board
 
         # used characters for map: dots are roads, X villages, @ cities, • empty nodes, NN = hex number, r = resource
         """example layout (inaccurate):
@@ -330,52 +819,32 @@ class TuiOverseer:
         nothing_ = ""
         newline_ = "\n"
 
-        r = {}# road list: key: NNX where NN is road_id, X is braille char configuration; value: (char, color)
-        for road_id, road in board.roads.items():
-            occ = road.owner  # 0=empty, 1=p1, 2=p2
-
-            color = self.C_HL if highlight_id == (2, road_id) else self.C_P1 if occ == 1 else self.C_P2 if occ == 2 else self.C_DEFAULT
-
-            if road_id in (69,71,43,67,28,12,31,65,26,5,7,32,38,10,2,17,50,37,21,19,52,58,56,54):
-                r.setdefault(f"{road_id:02d}1", ("⠋", color))  # -> r["691"] = ("⠋", color)
-                r.setdefault(f"{road_id:02d}2", ("⢀", color))
-                r.setdefault(f"{road_id:02d}3", ("⡤", color))
-            elif road_id in (68,41,30,45,66,27,6,14,47,64,52,4,1,16,62,23,9,18,51,60,36,35,53,25,49):
-                r.setdefault(f"{road_id:02d}1", ("⡇", color))
-            else:
-                r.setdefault(f"{road_id:02d}1", ("⢤", color))
-                r.setdefault(f"{road_id:02d}2", ("⡀", color))
-                r.setdefault(f"{road_id:02d}3", ("⠙", color))
-
-        n = {}# nodelist: key: NN0 where NN is node_id, value: (char, color)
-        for node_id, node in board.nodes.items():
-            occ = node.occupant
+        r = {}# road list: key: NNX where NN is road_id, X is braille char configuration; value: (char, color, tag)
+        for road_id in board.roads:
+            tag = (2, road_id)
+            for part, char in enumerate(_road_chars(road_id), 1):
+                r.setdefault(f"{road_id:02d}{part}", (char, None, tag))  # -> r["691"] = ("⠋", None, (2, 69))
 
-            color = self.C_HL if highlight_id == (1, node_id) else self.C_P1 if occ in (1,3) else self.C_P2 if occ in (2,4) else  self.C_DEFAULT
+        n = {}# nodelist: key: NN0 where NN is node_id, value: (char, color, tag)
+        for node_id in board.nodes:
+            n.setdefault(f"{node_id:02d}0", (None, None, (1, node_id)))
 
-            char = "•" if occ == 0 else "X" if occ in (1,2) else "@"
-            n.setdefault(f"{node_id:02d}0", (char, color))
-
-        d = {} # decoration list: key: NNX where NN is hex_id, X is 0 for decoration, 1 for left-half-of-number, 2 for right-half-of-number; value: (char, color)
+        d = {} # decoration list: key: NNX where NN is hex_id, X is 0 for decoration, 1 for left-half-of-number, 2 for right-half-of-number; value: (char, color, None)
+        no_resource = (" ", self.C_DEFAULT)  # desert
         for hex_id, hex_tile in board.hexes.items():
-            res = hex_tile.resource
             num = hex_tile.dice_number
+            res_char, color = self._hex_glyph.get(hex_tile.resource, no_resource)
 
-            res_char = "↑" if res == "wood" else "v" if res == "sheep" else "■" if res == "brick" else "W" if res == "wheat" else "■" if res == "ore" else " "
-            color = self.C_GRASS if res == "wood" else self.C_GRASS if res == "sheep" else self.C_BRICK if res == "brick" else self.C_WHEAT if res == "wheat" else self.C_ORE if res == "ore" else self.C_DEFAULT
-
-            d.setdefault(f"{hex_id:02d}0", (res_char, color))
+            d.setdefault(f"{hex_id:02d}0", (res_char, color, None))
 
             num_char_1 = str(num)[0] if num >= 10 else " "
             num_char_2 = str(num)[1] if num >= 10 else str(num)
-            d.setdefault(f"{hex_id:02d}1", (num_char_1, self.C_DEFAULT))
-            d.setdefault(f"{hex_id:02d}2", (num_char_2, self.C_DEFAULT))
+            d.setdefault(f"{hex_id:02d}1", (num_char_1, self.C_DEFAULT, None))
+            d.setdefault(f"{hex_id:02d}2", (num_char_2, self.C_DEFAULT, None))
 
-        ports = {} # port list: key: X where X is port type; value: (char, color)
-        for p in range(6):
-            port_char = "G" if p == 0 else "B" if p == 1 else "W" if p == 2 else "S" if p == 3 else "W" if p == 4 else "O" if p == 5 else " "
-            port_color = self.C_DICE if p == 0 else self.C_BRICK if p == 1 else self.C_GRASS if p == 2 else self.C_GRASS if p == 3 else self.C_WHEAT if p == 4 else self.C_ORE if p == 5 else self.C_DEFAULT
-            ports[p] = (port_char, port_color)
+        ports = {} # port list: key: X where X is port type; value: (char, color, None)
+        for p, (port_char, port_color) in enumerate(self._port_glyph):
+            ports[p] = (port_char, port_color, None)
 
         map = [
             nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,ports[4],nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,newline_,
@@ -399,98 +868,50 @@ class TuiOverseer:
             nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,nothing_,newline_,
         ]
         
+        cells = []
+        y = x = 0
         for item in map:
             if item == nothing_:
-                self.stdscr.addstr(y, x, " ", self.C_DEFAULT)
+                cells.append((y, x, " ", self.C_DEFAULT, None))
                 x += 1
             elif item == newline_:
                 y += 1
                 x = 0
             else:
-                char, color = item
-                try:
-                    self.stdscr.addstr(y, x, char, color)
-                except curses.error:
-                    pass
+                char, color, tag = item
+                cells.append((y, x, char, color, tag))
                 x += 1
+        self._map_template_cells = cells
+        return cells
 
 
-    def draw_dice(self, y, x, h, w, state):
+    def draw_dice(self, win, y, x, h, w, state):
         """
         Draws the recent dice as compact ASCII dice.
         Each roll is two dice side-by-side.
         """
 
-        # Unicode pip
-        pip = "●"
-
-        # Predefined pip patterns for a 3x3 grid
-        # (row, col) => pip position inside the 3×3 inner area
-        dice_patterns = {
-            1: {(1, 1)},
-            2: {(0, 0), (2, 2)},
-            3: {(0, 0), (1, 1), (2, 2)},
-            4: {(0, 0), (0, 2), (2, 0), (2, 2)},
-            5: {(0, 0), (0, 2), (1, 1), (2, 0), (2, 2)},
-            6: {(0, 0), (0, 2), (1, 0), (1, 2), (2, 0), (2, 2)},
-        }
-
-        def draw_single_die(top_y, left_x, value):
-            # top border
-            try:
-                self.stdscr.addstr(top_y, left_x,  "┌───────┐", self.C_DICE)
-            except curses.error:
-                pass
-
-            # inside pip rows
-            for r in range(3):
-                line = "│"
-                for c in range(3):
-                    if (r, c) in dice_patterns[value]:
-                        line += f" {pip}"
-                    else:
-                        line += "  "
-                line += " │"
-                try:
-                    self.stdscr.addstr(top_y + 1 + r, left_x, line, self.C_DICE)
-                except curses.error:
-                    pass
-
-            # bottom border
-            try:
-                self.stdscr.addstr(top_y + 4, left_x, "└───────┘", self.C_DICE)
-            except curses.error:
-                pass
-
         # Draw header
-        try:
-            self.stdscr.addstr(y, x + 1, "Dice:", self.C_DICE | curses.A_BOLD)
-        except curses.error:
-            pass
+        self._put(win, y, x + 1, "Dice:", self.C_DICE | curses.A_BOLD)
 
         rolls = state.get("last_rolls", [])
 
-        # reverse order: most recent on top
-        rolls = list(reversed(rolls))
-
         draw_y = y + 2
 
-        for (d1, d2) in rolls:
+        # reverse order: most recent on top
+        for roll in reversed(rolls):
             if draw_y + 5 > y + h:
                 break
 
-            draw_single_die(draw_y, x + 1, d1)
-            draw_single_die(draw_y, x + 10, d2)
+            for r, line in enumerate(DIE_PAIR_LINES[roll]):
+                self._put(win, draw_y + r, x + 1, line, self.C_DICE)
 
             draw_y += 6  # space below dice
 
         if not rolls:
-            try:
-                self.stdscr.addstr(y + 2, x + 1, "(no rolls yet)", self.C_DEFAULT)
-            except curses.error:
-                pass
+            self._put(win, y + 2, x + 1, "(no rolls yet)", self.C_DEFAULT)
 
-    def draw_player_panel(self, y, x, h, w, state):
+    def draw_player_panel(self, win, y, x, h, w, state):
         """
         top line looks like "{CP} bunch of space {OP} a little less space Turn: N" CP and OP are colored
         the left three-quarters is for current player, right quarter for opponent
@@ -512,13 +933,18 @@ class TuiOverseer:
         op = 2 if cp == 1 else 1
         
         # header line
-        header = f"{' ' * (5)}P1's victory points = {state['victory_points_cp'] if cp == 1 else state['victory_points_op']}     P2's victory points = {state['victory_points_op'] if cp == 1 else state['victory_points_cp']}{' ' * (5)} Turn: {state['turn_number']}"
-        try:
-            self.stdscr.addstr(y, x, header, self.C_DEFAULT)
-            self.stdscr.addstr(y + 1, x, f"P{cp}", self.C_P1 if cp == 1 else self.C_P2)
-            self.stdscr.addstr(y + 1, x + w - col_4_w, f"P{op}", self.C_P1 if op == 1 else self.C_P2)
-        except curses.error:
-            pass
+        points = f"P1's victory points = {state['victory_points_cp'] if cp == 1 else state['victory_points_op']}     P2's victory points = {state['victory_points_op'] if cp == 1 else state['victory_points_cp']}"
+        turn = f"Turn: {state['turn_number']}"
+        # up to 5 columns of padding on either side of the points, less when the panel is narrow
+        pad = ' ' * max(0, min(5, (w - len(points) - len(turn) - 1) // 2))
+        header = f"{pad}{points}{pad} {turn}"
+        # the opponent column is at least as wide as its heading, taken from column 3 if need be
+        opponent_label = f"P{op} Resources:"
+        col_4_w = max(col_4_w, len(opponent_label) + 1)
+
+        self._put(win, y, x, header, self.C_DEFAULT)
+        self._put(win, y + 1, x, f"P{cp}", self.C_P1 if cp == 1 else self.C_P2)
+        self._put(win, y + 1, x + w - col_4_w, f"P{op}", self.C_P1 if op == 1 else self.C_P2)
 
         # --- Columns start at y + 2 ---
         left_x = x
@@ -528,141 +954,96 @@ class TuiOverseer:
         start_y = top_y + 2
 
         # --- Column 1: Actions ---
-        action_labels = ["Finish Turn", "Build Village", "Build Road", "Build City"]
-        action_keys = ["finish", "village", "road", "city"]
-
-        try:
-            self.stdscr.addstr(start_y, left_x + 1, "Actions:", curses.A_BOLD)
-        except curses.error:
-            pass
+        self._put(win, start_y, left_x + 1, "Actions:", curses.A_BOLD)
 
-        for i, (label, key) in enumerate(zip(action_labels, action_keys)):
+        list_x = left_x + col_1_w // 2 - 2
+        selection = self.selection[cp]
+        label_attrs = (self.C_DEFAULT, self.C_HL)  # indexed by whether the row is selected
+        for i, (label, key, state_key) in enumerate(self.ACTION_LABELS):
             row_y = start_y + i * 2
             active = (self.selected_row == i)
-            attr = self.C_HL if active else self.C_DEFAULT
+            attr = label_attrs[active]
 
             # Draw label
-            try:
-                self.stdscr.addstr(row_y + 1, left_x + 1, f"{label}:", attr)
-            except curses.error:
-                pass
+            self._put(win, row_y + 1, left_x + 1, label, attr)
 
             # Draw list for village/road/city
-            if key != "finish":
-                if key == "city":
-                    lst = state.get(f"available_cities_cp", [])
-                else:
-                    lst = state.get(f"available_{key}s_cp", [])
-                sel = self._safe_index(lst, self.selection[cp][key])
-                self.selection[cp][key] = sel
-                self._draw_list(row_y + 1, left_x + col_1_w // 2 - 2, lst, sel, active=active)
+            if state_key is not None:
+                lst = state.get(state_key, [])
+                sel = selection[key] = self._safe_index(lst, selection[key])
+                self._draw_list(win, row_y + 1, list_x, lst, sel, active=active)
             else:
-                try:
-                    self.stdscr.addstr(row_y + 1, left_x + col_1_w // 2 - 2, "[]", attr)
-                except curses.error:
-                    pass
+                self._put(win, row_y + 1, list_x, "[]", attr)
 
         # --- Column 2: Resources ---
         res_y = start_y
-        try:
-            self.stdscr.addstr(res_y, left_x + col_1_w + 1, "Resources:", curses.A_BOLD)
-        except curses.error:
-            pass
-        self.draw_resources(res_y + 1, left_x + col_1_w + 1, state[f"resources_cp"])
+        self._put(win, res_y, left_x + col_1_w + 1, "Resources:", curses.A_BOLD)
+        self.draw_resources(win, res_y + 1, left_x + col_1_w + 1, state["resources_cp"])
 
         # --- Column 3: Trade Receive ---
         trade_y = start_y
-        try:
-            self.stdscr.addstr(trade_y, left_x + col_1_w + col_2_w + 1, "Trade Receive:", curses.A_BOLD)
-        except curses.error:
-            pass
+        self._put(win, trade_y, left_x + col_1_w + col_2_w + 1, "Trade Receive:", curses.A_BOLD)
 
         trade_offers = state["available_trade_offers_cp"]
-        lst_receive = list(trade_offers.keys())
-        sel_receive = self._safe_index(lst_receive, self.selection[cp]["trade_receive"])
-        self.selection[cp]["trade_receive"] = sel_receive
+        lst_receive = self._receive_options(state)
+        sel_receive = selection["trade_receive"] = self._safe_index(lst_receive, selection["trade_receive"])
         self.selected_resource_to_receive[cp] = lst_receive[sel_receive] if lst_receive else None
-        self._draw_list(trade_y + 1, left_x + col_1_w + col_2_w + 1, lst_receive, sel_receive,
+        self._draw_list(win, trade_y + 1, left_x + col_1_w + col_2_w + 1, lst_receive, sel_receive,
                         active=(True))
 
         # --- Column 3: Trade Give ---
-        try:
-            self.stdscr.addstr(trade_y + 4, left_x + col_1_w + col_2_w + 1, "Trade Give:", curses.A_BOLD)
-        except curses.error:
-            pass
+        self._put(win, trade_y + 4, left_x + col_1_w + col_2_w + 1, "Trade Give:", curses.A_BOLD)
 
-        if self.selected_resource_to_receive[cp] and trade_offers.get(self.selected_resource_to_receive[cp]):
-            lst_give = [f"{res} x{amt}" for res, amt in trade_offers[self.selected_resource_to_receive[cp]]]
-        else:
-            lst_give = []
-        sel_give = self._safe_index(lst_give, self.selection[cp]["trade_give"])
-        self.selection[cp]["trade_give"] = sel_give
-        self._draw_list(trade_y + 5, left_x + col_1_w + col_2_w + 1, lst_give, sel_give,
+        offers = trade_offers.get(self.selected_resource_to_receive[cp])
+        lst_give = [f"{res} x{amt}" for res, amt in offers] if offers else []
+        sel_give = selection["trade_give"] = self._safe_index(lst_give, selection["trade_give"])
+        self._draw_list(win, trade_y + 5, left_x + col_1_w + col_2_w + 1, lst_give, sel_give,
                         active=(self.selected_row == 5))
 
         # --- Column 4: Opponent Resources ---
-        try:
-            self.stdscr.addstr(start_y, right_x + 1, f"P{op} Resources:", curses.A_BOLD)
-        except curses.error:
-            pass
-        self.draw_resources(start_y + 1, right_x + 1, state[f"resources_op"])
+        self._put(win, start_y, right_x + 1, opponent_label, curses.A_BOLD)
+        self.draw_resources(win, start_y + 1, right_x + 1, state["resources_op"])
 
-    def draw_resources(self, y, x, resources):
+    def draw_resources(self, win, y, x, resources):
         # layout:
         # Wood: W W W
         # Brick: B B
         # Wheat: H H
         # Sheep: S S
         # Ore: O
-        try:
-            wood = " ".join("W" for _ in range(resources.get("wood", 0)))
-            brick = " ".join("B" for _ in range(resources.get("brick", 0)))
-            wheat = " ".join("H" for _ in range(resources.get("wheat", 0)))
-            sheep = " ".join("S" for _ in range(resources.get("sheep", 0)))
-            ore = " ".join("O" for _ in range(resources.get("ore", 0)))
-
-            self.stdscr.addstr(y, x, f"Wood: {wood}", self.C_DEFAULT)
-            self.stdscr.addstr(y+1, x, f"Brick: {brick}", self.C_DEFAULT)
-            self.stdscr.addstr(y+2, x, f"Wheat: {wheat}", self.C_DEFAULT)
-            self.stdscr.addstr(y+3, x, f"Sheep: {sheep}", self.C_DEFAULT)
-            self.stdscr.addstr(y+4, x, f"Ore: {ore}", self.C_DEFAULT)
-        except curses.error:
-            pass
-
-    def _draw_list(self, row_y, sx, lst, sel, active):
-        """Draws a list inside [ ... ] always correctly."""
-        # Opening bracket
-        try:
-            self.stdscr.addstr(row_y, sx, "[", self.C_DEFAULT)
-        except curses.error:
-            pass
-        sx += 1
+        for i, (resource, label, char) in enumerate(RESOURCE_ROWS):
+            count = resources.get(resource, 0)
+            if count <= RESOURCE_LINE_MAX:
+                line = RESOURCE_LINES[resource][count]
+            else:
+                line = _resource_line(label, char, count)
+            self._put(win, y + i, x, line, self.C_DEFAULT)
 
-        # Empty → just closing bracket
+    def _draw_list(self, win, row_y, sx, lst, sel, active):
+        """
+        Draws a list inside [ ... ] always correctly.
+        Only the highlighted item differs in color, so the items on either side of it
+        go out as one string each.
+        """
+        # Empty → just the brackets
         if not lst:
-            try:
-                self.stdscr.addstr(row_y, sx, "]", self.C_DEFAULT)
-            except curses.error:
-                pass
+            self._put(win, row_y, sx, "[]", self.C_DEFAULT)
             return
 
         # Non-empty: windowed
-        window, start = centered_window(lst, sel, width=5)
-        for iwin, val in enumerate(window):
-            idx = start + iwin
-            col = self.C_HL if (idx == sel and active) else self.C_DEFAULT
-            text = f" {val} "
-            try:
-                self.stdscr.addstr(row_y, sx, text, col)
-            except curses.error:
-                pass
-            sx += len(text)
+        start, end = centered_window_range(len(lst), sel, width=5)
+        if not (active and start <= sel < end):
+            items = "".join([f" {lst[idx]} " for idx in range(start, end)])
+            self._put(win, row_y, sx, f"[{items}]", self.C_DEFAULT)
+            return
 
-        # Closing bracket
-        try:
-            self.stdscr.addstr(row_y, sx, "]", self.C_DEFAULT)
-        except curses.error:
-            pass
+        before = "[" + "".join([f" {lst[idx]} " for idx in range(start, sel)])
+        selected = f" {lst[sel]} "
+        after = "".join([f" {lst[idx]} " for idx in range(sel + 1, end)]) + "]"
+        self._put(win, row_y, sx, before, self.C_DEFAULT)
+        sx += len(before)
+        self._put(win, row_y, sx, selected, self.C_HL)
+        self._put(win, row_y, sx + len(selected), after, self.C_DEFAULT)
 
 
 